@@ -1,22 +1,93 @@
 """ACP client for communicating with kiro-cli via JSON-RPC 2.0 over stdio."""
 
-import json
+import fcntl
+import itertools
 import logging
 import os
+import re
+import selectors
 import signal
 import subprocess
+import sys
 import threading
 import time
 from dataclasses import dataclass, field
 from typing import Callable
 
+import orjson
+
 log = logging.getLogger(__name__)
 
-# Max bytes per stdout line
+# Max bytes per stdout/stderr line
 _BUF_SIZE = 4 * 1024 * 1024
 
+# Bytes requested per os.read() on the stdout/stderr pipes
+_READ_SIZE = 64 * 1024
+
+# Kernel pipe size requested for kiro-cli stdin/stdout (default is 64 KiB)
+_PIPE_SIZE = 1024 * 1024
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", None)
+
+# Size of the in-flight request slot ring (power of two, masked by req_id)
+_MAX_PENDING = 256
+_PENDING_MASK = _MAX_PENDING - 1
+
+# Events kept ready for reuse by _send_request_with_id
+_EVENT_POOL_SIZE = 8
+
+# Lines at least this large get the unclaimed session/update pre-check
+_LARGE_LINE = 16 * 1024
+# Unescaped "method":"session/update" can only appear as JSON structure,
+# never inside a string value (quotes there are escaped)
+_SESSION_UPDATE_RE = re.compile(rb'"method"\s*:\s*"session/update"')
+
+# Incoming method names (interned: they key the dispatch tables)
+_METHOD_SESSION_UPDATE = sys.intern("session/update")
+_METHOD_COMMANDS_AVAILABLE = sys.intern("_kiro.dev/commands/available")
+_METHOD_REQUEST_PERMISSION = sys.intern("session/request_permission")
+
+# session/update kinds folded into _PromptState
+_UPDATE_MESSAGE_CHUNK = 0
+_UPDATE_TOOL_CALL = 1
+_UPDATE_TOOL_CALL_UPDATE = 2
+_UPDATE_KINDS = {
+    sys.intern("agent_message_chunk"): _UPDATE_MESSAGE_CHUNK,
+    sys.intern("tool_call"): _UPDATE_TOOL_CALL,
+    sys.intern("tool_call_update"): _UPDATE_TOOL_CALL_UPDATE,
+}
 
-@dataclass
+# Shared result body for denied permission requests (never mutated)
+_CANCELLED_RESULT = {"outcome": {"outcome": "cancelled"}}
+
+
+def _json_default(obj):
+    """orjson fallback: emit base64 image payloads (ASCII bytes) as JSON strings.
+    
+    Images travel as bytes from the adapters; they are only turned into str
+    here, once, while the request is being serialized.
+    """
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).decode("ascii")
+    raise TypeError
+
+
+def _extract_tool_text(blocks) -> str | None:
+    """Return the text of the last text block in tool_call_update content.
+    
+    Blocks look like {"type": "content", "content": {"type": "text", "text": ...}}.
+    Returns None if there is no text block.
+    """
+    if not blocks:
+        return None
+    text = None
+    for c in blocks:
+        inner = c.get("content") if type(c) is dict else None
+        if type(inner) is dict and inner.get("type") == "text":
+            text = inner.get("text", "")
+    return text
+
+
+@dataclass(slots=True)
 class ToolCallInfo:
     tool_call_id: str = ""
     title: str = ""
@@ -25,14 +96,22 @@ class ToolCallInfo:
     content: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptResult:
     text: str = ""
     tool_calls: list = field(default_factory=list)
     stop_reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
+class _PromptState:
+    """Response state accumulated from session/update notifications."""
+    text_parts: list[str] = field(default_factory=list)
+    tool_calls: list[ToolCallInfo] = field(default_factory=list)
+    tool_call_index: dict[str, int] = field(default_factory=dict)  # toolCallId -> index
+
+
+@dataclass(slots=True, frozen=True)
 class PermissionRequest:
     """Represents a permission request from Kiro."""
     session_id: str
@@ -49,12 +128,22 @@ class ACPClient:
     def __init__(self, cli_path: str = "kiro-cli"):
         self._cli_path = cli_path
         self._proc: subprocess.Popen | None = None
-        self._req_id = 0
+        self._stdin_fd = -1
+        # Request id source: count.__next__ is a single C call, no lock needed
+        self._next_id = itertools.count(1).__next__
+        # Guards the Event pool and request slot reservation
         self._lock = threading.Lock()
-        # pending request id -> threading.Event + result holder
-        self._pending: dict[int, tuple[threading.Event, list]] = {}
-        # session_id -> list of notifications for current prompt
-        self._session_updates: dict[str, list[dict]] = {}
+        # Reusable request Events (LIFO), guarded by _lock
+        self._event_pool: list[threading.Event] = [threading.Event() for _ in range(_EVENT_POOL_SIZE)]
+        # Guards stdin writes (one JSON-RPC line at a time)
+        self._write_lock = threading.Lock()
+        # In-flight requests: slot (req_id & mask) -> (Event, result holder, req_id)
+        self._pending_slots: list[tuple[threading.Event, list, int] | None] = [None] * _MAX_PENDING
+        # req_id -> same entry, for ids whose slot is still held by an older
+        # long-running request (e.g. a prompt from 256 ids ago)
+        self._pending_overflow: dict[int, tuple[threading.Event, list, int]] = {}
+        # session_id -> response state folded from the current prompt's updates
+        self._session_updates: dict[str, _PromptState] = {}
         # session_id -> current prompt request id (for cancellation)
         self._active_prompts: dict[str, int] = {}
         # Permission request handler
@@ -65,6 +154,11 @@ class ACPClient:
         self._session_models: dict[str, dict] = {}
         # session_id -> available commands (from _kiro.dev/commands/available)
         self._session_commands: dict[str, list] = {}
+        # Notification method -> handler(params, session_id)
+        self._notification_handlers: dict[str, Callable[[dict, str], None]] = {
+            _METHOD_SESSION_UPDATE: self._on_session_update,
+            _METHOD_COMMANDS_AVAILABLE: self._on_commands_available,
+        }
         self._running = False
 
     def on_permission_request(self, handler: PermissionHandler):
@@ -95,10 +189,12 @@ class ACPClient:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             bufsize=0,
+            start_new_session=True,  # Own process group, see stop()
         )
+        self._stdin_fd = self._proc.stdin.fileno()
+        self._grow_pipes()
         self._running = True
-        threading.Thread(target=self._read_loop, daemon=True).start()
-        threading.Thread(target=self._read_stderr, daemon=True).start()
+        threading.Thread(target=self._io_loop, daemon=True).start()
 
         result = self._send_request("initialize", {
             "protocolVersion": 1,
@@ -108,49 +204,55 @@ class ACPClient:
             },
             "clientInfo": {"name": "kirocli-bot-gateway", "version": "0.1.0"},
         })
-        log.info("[ACP] Initialized: %s", json.dumps(result, ensure_ascii=False)[:200])
+        log.info("[ACP] Initialized: protocolVersion=%s, keys=%d",
+                 result.get("protocolVersion"), len(result))
         return result
 
+    def _grow_pipes(self):
+        """Enlarge the kernel stdin/stdout pipes (Linux only, best effort).
+        
+        Image prompts can be megabytes of base64; a bigger pipe lets them go
+        out in fewer blocking writes.
+        """
+        if _F_SETPIPE_SZ is None:
+            return
+        for f in (self._proc.stdin, self._proc.stdout):
+            try:
+                fcntl.fcntl(f.fileno(), _F_SETPIPE_SZ, _PIPE_SIZE)
+            except OSError as e:
+                log.debug("[ACP] Could not resize pipe: %s", e)
+                return
+
     def stop(self):
         """Gracefully stop the subprocess and all its children."""
         self._running = False
         if self._proc and self._proc.poll() is None:
-            pid = self._proc.pid
+            # kiro-cli runs as its own process group leader (start_new_session),
+            # so one killpg reaches kiro-cli-chat and MCP servers as well
+            pgid = self._proc.pid
+            self._kill_group(pgid, signal.SIGTERM)
             
-            # First, find and kill child processes (kiro-cli-chat, MCP servers)
-            self._kill_children(pid)
-            
-            # Then close stdin and wait for parent to exit
-            self._proc.stdin.close()
+            # Then close stdin and wait for parent to exit. Drop the cached
+            # fd first so a late write can't hit a reused descriptor number
+            with self._write_lock:
+                self._stdin_fd = -1
+                self._proc.stdin.close()
             try:
                 self._proc.wait(timeout=5)
             except subprocess.TimeoutExpired:
-                self._proc.kill()
+                self._kill_group(pgid, signal.SIGKILL)
                 self._proc.wait()
         log.info("[ACP] Stopped")
 
-    def _kill_children(self, parent_pid: int):
-        """Kill all child processes of the given PID."""
+    def _kill_group(self, pgid: int, sig: int):
+        """Send a signal to the whole kiro-cli process group."""
         try:
-            # Find child PIDs using pgrep
-            result = subprocess.run(
-                ["pgrep", "-P", str(parent_pid)],
-                capture_output=True,
-                text=True,
-            )
-            child_pids = result.stdout.strip().split('\n')
-            for pid_str in child_pids:
-                if pid_str:
-                    child_pid = int(pid_str)
-                    # Recursively kill grandchildren first
-                    self._kill_children(child_pid)
-                    try:
-                        os.kill(child_pid, signal.SIGTERM)
-                        log.debug("[ACP] Sent SIGTERM to child PID %d", child_pid)
-                    except ProcessLookupError:
-                        pass  # Already dead
+            os.killpg(pgid, sig)
+            log.debug("[ACP] Sent signal %d to process group %d", sig, pgid)
+        except ProcessLookupError:
+            pass  # Already dead
         except Exception as e:
-            log.debug("[ACP] Error killing children: %s", e)
+            log.debug("[ACP] Error killing process group: %s", e)
 
     def is_running(self) -> bool:
         return self._running and self._proc is not None and self._proc.poll() is None
@@ -264,17 +366,17 @@ class ACPClient:
         """Get available commands for a session (from _kiro.dev/commands/available notification)."""
         return self._session_commands.get(session_id, [])
 
-    def session_prompt(self, session_id: str, text: str, images: list[tuple[str, str]] | None = None, timeout: float = 300) -> PromptResult:
+    def session_prompt(self, session_id: str, text: str, images: list[tuple[bytes, str]] | None = None, timeout: float = 300) -> PromptResult:
         """Send a prompt and collect the full response (blocking).
         
         Args:
             session_id: Session ID
             text: Text content
-            images: List of (base64_data, mime_type) tuples
+            images: List of (base64_bytes, mime_type) tuples
             timeout: Timeout in seconds
         """
         # Prepare collection state for this session
-        self._session_updates[session_id] = []
+        self._session_updates[session_id] = _PromptState()
 
         # Track active prompt for cancellation
         req_id = self._next_id()
@@ -286,6 +388,7 @@ class ACPClient:
             
             # Add images first (Kiro supports promptCapabilities.image: true)
             # ACP spec: {"type": "image", "data": "<base64>", "mimeType": "image/jpeg"}
+            # data stays base64 bytes; _json_default emits it as a string
             if images:
                 for b64_data, mime_type in images:
                     prompt_content.append({
@@ -330,39 +433,72 @@ class ACPClient:
             "method": "session/cancel",
             "params": {"sessionId": session_id},
         }
-        data = json.dumps(msg, ensure_ascii=False) + "\n"
+        data = orjson.dumps(msg, option=orjson.OPT_APPEND_NEWLINE)
         log.info("[ACP] Cancelling session: %s", session_id)
-        log.debug("[ACP] >>> %s", data.strip())
-        self._proc.stdin.write(data.encode())
-        self._proc.stdin.flush()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[ACP] >>> %s", data.decode().strip())
+        self._write(data)
 
     # ── Internal: JSON-RPC transport ──
 
-    def _next_id(self) -> int:
+    def _write(self, data: bytes):
+        """Write one framed message to kiro-cli stdin.
+        
+        Serialized so that concurrent senders (prompt, cancel, permission
+        responses) never interleave partial lines on the pipe.
+        """
+        view = memoryview(data)
+        with self._write_lock:
+            fd = self._stdin_fd
+            if fd < 0:
+                raise RuntimeError("kiro-cli stdin is closed")
+            # One os.write per message in the common case; loop on short writes
+            while view:
+                view = view[os.write(fd, view):]
+
+    def _put_event(self, evt: threading.Event):
+        evt.clear()
         with self._lock:
-            self._req_id += 1
-            return self._req_id
+            if len(self._event_pool) < _EVENT_POOL_SIZE:
+                self._event_pool.append(evt)
 
     def _send_request(self, method: str, params: dict, timeout: float = 300) -> dict:
         return self._send_request_with_id(method, params, self._next_id(), timeout)
 
     def _send_request_with_id(self, method: str, params: dict, req_id: int, timeout: float = 300) -> dict:
         msg = {"jsonrpc": "2.0", "id": req_id, "method": method, "params": params}
-        data = json.dumps(msg, ensure_ascii=False) + "\n"
+        data = orjson.dumps(msg, default=_json_default, option=orjson.OPT_APPEND_NEWLINE)
 
-        evt = threading.Event()
         holder: list = []  # [result_dict] or [None, error_dict]
-        self._pending[req_id] = (evt, holder)
-
-        log.info("[ACP] >>> SENDING: %s", data.strip())
-        self._proc.stdin.write(data.encode())
-        self._proc.stdin.flush()
-
-        if not evt.wait(timeout=timeout):
-            self._pending.pop(req_id, None)
-            raise TimeoutError(f"Request {method} (id={req_id}) timed out")
+        slot = req_id & _PENDING_MASK
+        with self._lock:
+            evt = self._event_pool.pop() if self._event_pool else threading.Event()
+            entry = (evt, holder, req_id)
+            if self._pending_slots[slot] is None:
+                self._pending_slots[slot] = entry
+            else:
+                slot = -1
+                self._pending_overflow[req_id] = entry
+
+        if log.isEnabledFor(logging.INFO):
+            log.info("[ACP] >>> SENDING: %s", data.decode().strip())
+        completed = False
+        try:
+            self._write(data)
+            if not evt.wait(timeout=timeout):
+                raise TimeoutError(f"Request {method} (id={req_id}) timed out")
+            completed = True
+        finally:
+            if slot >= 0:
+                self._pending_slots[slot] = None
+            else:
+                with self._lock:
+                    del self._pending_overflow[req_id]
+            # Only recycle Events whose response already arrived; a timed-out
+            # one could still be set late by the read loop
+            if completed:
+                self._put_event(evt)
 
-        self._pending.pop(req_id, None)
         if len(holder) == 2 and holder[0] is None:
             err = holder[1]
             raise RuntimeError(f"RPC error {err.get('code')}: {err.get('message')}")
@@ -370,83 +506,183 @@ class ACPClient:
 
     # ── Internal: read loops ──
 
-    def _read_loop(self):
-        while self._running:
-            try:
-                line = self._proc.stdout.readline(_BUF_SIZE)
-                if not line:
-                    break
-                self._handle_line(line.decode(errors="replace").strip())
-            except Exception as e:
-                if self._running:
-                    log.error("[ACP] Read error: %s", e)
-                break
-        log.info("[ACP] Read loop exited")
-        self._running = False
-
-    def _read_stderr(self):
-        while self._running:
-            try:
-                line = self._proc.stderr.readline()
-                if not line:
-                    break
-                log.debug("[ACP stderr] %s", line.decode(errors="replace").strip())
-            except Exception:
-                break
-
-    def _handle_line(self, line: str):
+    def _io_loop(self):
+        """Single reader thread for both stdout and stderr of kiro-cli.
+        
+        Raw reads + manual newline framing: one syscall can carry many
+        session/update lines, and no buffered-IO lock per line. stderr is
+        nearly idle, so it shares this thread via a selector.
+        
+        select() blocks without a timeout: the thread only wakes when kiro-cli
+        writes something, and stop() ends it via stdout EOF once the process
+        group is gone.
+        """
+        stdout_fd = self._proc.stdout.fileno()
+        sel = selectors.DefaultSelector()
+        # key.data = (line buffer, line handler) for each pipe
+        sel.register(stdout_fd, selectors.EVENT_READ, (bytearray(), self._handle_line))
+        sel.register(self._proc.stderr.fileno(), selectors.EVENT_READ,
+                     (bytearray(), self._handle_stderr_line))
+        try:
+            while self._running:
+                for key, _ in sel.select():
+                    chunk = os.read(key.fd, _READ_SIZE)
+                    if not chunk:
+                        if key.fd == stdout_fd:
+                            return
+                        sel.unregister(key.fd)
+                        continue
+                    buf, handler = key.data
+                    self._drain_lines(buf, chunk, handler)
+        except Exception as e:
+            if self._running:
+                log.error("[ACP] Read error: %s", e)
+        finally:
+            sel.close()
+            log.info("[ACP] Read loop exited")
+            self._running = False
+
+    def _drain_lines(self, buf: bytearray, chunk: bytes, handler: Callable[[bytes], None]):
+        """Append chunk to buf and pass every complete line to handler."""
+        buf += chunk
+        start = 0
+        while (nl := buf.find(b"\n", start)) >= 0:
+            handler(bytes(buf[start:nl]).strip())
+            start = nl + 1
+        if start:
+            del buf[:start]
+        if len(buf) > _BUF_SIZE:
+            log.warning("[ACP] Dropping oversized line (%d bytes)", len(buf))
+            buf.clear()
+
+    def _handle_stderr_line(self, line: bytes):
+        if line and log.isEnabledFor(logging.DEBUG):
+            log.debug("[ACP stderr] %s", line.decode(errors="replace"))
+
+    def _handle_line(self, line: bytes):
         if not line:
             return
+        if len(line) >= _LARGE_LINE and self._is_unclaimed_update(line):
+            # e.g. history replayed by session/load: nobody collects it, so
+            # don't build a Python tree for it at all
+            log.debug("[ACP] Skipped unclaimed session/update (%d bytes)", len(line))
+            return
         try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
-            log.warning("[ACP] Non-JSON line: %s", line[:200])
+            # orjson parses the raw UTF-8 bytes directly, no decode step needed
+            msg = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            log.warning("[ACP] Non-JSON line: %s", line[:200].decode(errors="replace"))
             return
 
-        log.info("[ACP] <<< RECEIVED: %s", line[:500])
+        if log.isEnabledFor(logging.INFO):
+            log.info("[ACP] <<< RECEIVED: %s", line[:500].decode(errors="replace"))
 
-        msg_id = msg.get("id")
-        method = msg.get("method")
+        m_get = msg.get
+        method = m_get("method")
+        msg_id = m_get("id")
+
+        # Notification (has "method" but no "id") - the bulk of the traffic
+        if msg_id is None:
+            if method:
+                handler = self._notification_handlers.get(method)
+                if handler:
+                    params = m_get("params", {})
+                    handler(params, params.get("sessionId", ""))
+            return
 
         # Response to a pending request (has "id" and "result" or "error", no "method")
-        if msg_id is not None and method is None and (msg.get("result") is not None or msg.get("error") is not None):
-            pending = self._pending.get(msg_id)
-            if pending:
-                evt, holder = pending
-                if msg.get("error"):
+        if method is None:
+            error = m_get("error")
+            result = m_get("result")
+            if result is None and error is None:
+                return  # Neither result nor error: not a response, ignore
+            pending = self._pending_slots[msg_id & _PENDING_MASK] if isinstance(msg_id, int) else None
+            if (pending is None or pending[2] != msg_id) and self._pending_overflow:
+                pending = self._pending_overflow.get(msg_id)
+            if pending and pending[2] == msg_id:
+                evt, holder, _ = pending
+                if error:
                     holder.append(None)
-                    holder.append(msg["error"])
+                    holder.append(error)
                 else:
-                    holder.append(msg.get("result", {}))
+                    holder.append({} if result is None else result)
                 evt.set()
             return
 
         # Request from agent (has "id" and "method") - e.g. session/request_permission
-        if msg_id is not None and method:
-            params = msg.get("params", {})
-            if method == "session/request_permission":
-                self._handle_permission_request(msg_id, params)
-            return
+        if method == _METHOD_REQUEST_PERMISSION:
+            self._handle_permission_request(msg_id, m_get("params", {}))
 
-        # Notification (has "method" but no "id")
-        if method and msg_id is None:
-            params = msg.get("params", {})
-            session_id = params.get("sessionId", "")
+    def _is_unclaimed_update(self, line: bytes) -> bool:
+        """Cheap byte-level check for a session/update no prompt is waiting on.
+        
+        Conservative: anything that might be a response (has a top-level
+        looking "result"/"error" key) is left to the normal parser.
+        """
+        if self._session_updates:
+            return False
+        if b'"result"' in line or b'"error"' in line:
+            return False
+        return _SESSION_UPDATE_RE.search(line) is not None
+
+    def _on_session_update(self, params: dict, session_id: str):
+        """Fold a session/update notification into the active prompt's state.
+        
+        Done here on the read loop as updates arrive, so building the final
+        PromptResult does not have to re-scan every chunk.
+        """
+        if not session_id:
+            return
+        state = self._session_updates.get(session_id)
+        if state is None:
+            return
 
-            if method == "session/update" and session_id:
-                updates = self._session_updates.get(session_id)
-                if updates is not None:
-                    updates.append(params.get("update", {}))
-            
-            elif method == "_kiro.dev/commands/available":
-                # Store available commands for this session
-                commands = params.get("commands", [])
-                if session_id and commands:
-                    self._session_commands[session_id] = commands
-                    log.info("[ACP] Received %d commands for session %s", len(commands), session_id)
-                    # Print full command details
-                    for cmd in commands:
-                        log.info("[ACP] Command: %s", json.dumps(cmd, ensure_ascii=False))
+        update = params.get("update", {})
+        u_get = update.get
+        kind = _UPDATE_KINDS.get(u_get("sessionUpdate"))
+        if kind == _UPDATE_MESSAGE_CHUNK:
+            content = u_get("content", {})
+            if isinstance(content, dict) and content.get("type") == "text":
+                state.text_parts.append(content.get("text", ""))
+        elif kind == _UPDATE_TOOL_CALL:
+            tc_id = u_get("toolCallId", "")
+            tc = ToolCallInfo(
+                tool_call_id=tc_id,
+                title=u_get("title", ""),
+                kind=u_get("kind", ""),
+                status=u_get("status", "pending"),
+            )
+            idx = state.tool_call_index.get(tc_id)
+            if idx is None:
+                state.tool_call_index[tc_id] = len(state.tool_calls)
+                state.tool_calls.append(tc)
+            else:
+                state.tool_calls[idx] = tc
+        elif kind == _UPDATE_TOOL_CALL_UPDATE:
+            idx = state.tool_call_index.get(u_get("toolCallId", ""))
+            if idx is None:
+                return
+            tc = state.tool_calls[idx]
+            tc.status = u_get("status", tc.status)
+            # Update title if provided
+            title = u_get("title")
+            if title:
+                tc.title = title
+            # Extract text content if present
+            text = _extract_tool_text(u_get("content"))
+            if text is not None:
+                tc.content = text
+
+    def _on_commands_available(self, params: dict, session_id: str):
+        """Store available commands for a session (Kiro extension)."""
+        commands = params.get("commands", [])
+        if session_id and commands:
+            self._session_commands[session_id] = commands
+            log.info("[ACP] Received %d commands for session %s", len(commands), session_id)
+            # Print full command details
+            if log.isEnabledFor(logging.INFO):
+                for cmd in commands:
+                    log.info("[ACP] Command: %s", orjson.dumps(cmd).decode())
 
     def _handle_permission_request(self, msg_id, params: dict):
         """Handle permission request from Kiro."""
@@ -472,8 +708,7 @@ class ACPClient:
             options=options,
         )
 
-        # Call handler in a separate thread to not block the read loop
-        def handle_async():
+        def handle():
             try:
                 decision = self._permission_handler(request)
                 if decision:
@@ -486,70 +721,28 @@ class ACPClient:
                 log.error("[ACP] Permission handler error: %s", e)
                 self._send_permission_response(msg_id, session_id, "deny")
 
-        threading.Thread(target=handle_async, daemon=True).start()
+        # Run in separate thread to not block the read loop
+        threading.Thread(target=handle, daemon=True).start()
 
     def _send_permission_response(self, msg_id, session_id: str, option_id: str):
         """Send permission response to Kiro."""
         if option_id == "deny":
             # Send cancelled outcome
-            response = {
-                "jsonrpc": "2.0",
-                "id": msg_id,
-                "result": {
-                    "outcome": {"outcome": "cancelled"}
-                }
-            }
+            result = _CANCELLED_RESULT
         else:
-            response = {
-                "jsonrpc": "2.0",
-                "id": msg_id,
-                "result": {
-                    "outcome": {"outcome": "selected", "optionId": option_id}
-                }
-            }
-        data = json.dumps(response, ensure_ascii=False) + "\n"
-        log.debug("[ACP] >>> %s", data.strip())
-        self._proc.stdin.write(data.encode())
-        self._proc.stdin.flush()
+            result = {"outcome": {"outcome": "selected", "optionId": option_id}}
+        response = {"jsonrpc": "2.0", "id": msg_id, "result": result}
+        data = orjson.dumps(response, option=orjson.OPT_APPEND_NEWLINE)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[ACP] >>> %s", data.decode().strip())
+        self._write(data)
 
     # ── Internal: result building ──
 
     def _build_prompt_result(self, session_id: str, rpc_result: dict) -> PromptResult:
-        updates = self._session_updates.pop(session_id, [])
-
-        result = PromptResult(stop_reason=rpc_result.get("stopReason", ""))
-        text_parts = []
-        tool_calls: dict[str, ToolCallInfo] = {}
-
-        for update in updates:
-            st = update.get("sessionUpdate", "")
-            if st == "agent_message_chunk":
-                content = update.get("content", {})
-                if isinstance(content, dict) and content.get("type") == "text":
-                    text_parts.append(content.get("text", ""))
-            elif st == "tool_call":
-                tc_id = update.get("toolCallId", "")
-                tool_calls[tc_id] = ToolCallInfo(
-                    tool_call_id=tc_id,
-                    title=update.get("title", ""),
-                    kind=update.get("kind", ""),
-                    status=update.get("status", "pending"),
-                )
-            elif st == "tool_call_update":
-                tc_id = update.get("toolCallId", "")
-                tc = tool_calls.get(tc_id)
-                if tc:
-                    tc.status = update.get("status", tc.status)
-                    # Update title if provided
-                    if update.get("title"):
-                        tc.title = update.get("title")
-                    # Extract text content if present
-                    for c in update.get("content", []):
-                        if isinstance(c, dict):
-                            inner = c.get("content", {})
-                            if isinstance(inner, dict) and inner.get("type") == "text":
-                                tc.content = inner.get("text", "")
-
-        result.text = "".join(text_parts)
-        result.tool_calls = list(tool_calls.values())
-        return result
+        state = self._session_updates.pop(session_id, None) or _PromptState()
+        return PromptResult(
+            text="".join(state.text_parts),
+            tool_calls=state.tool_calls,
+            stop_reason=rpc_result.get("stopReason", ""),
+        )
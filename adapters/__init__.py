@@ -1,6 +1,6 @@
 # Chat platform adapters
-from .base import ChatAdapter
+from .base import AdapterError, ChatAdapter
 from .feishu import FeishuAdapter
 from .discord import DiscordAdapter
 
-__all__ = ["ChatAdapter", "FeishuAdapter", "DiscordAdapter"]
+__all__ = ["AdapterError", "ChatAdapter", "FeishuAdapter", "DiscordAdapter"]
@@ -12,24 +12,28 @@ class ChatType(Enum):
     GROUP = "group"      # Group chat
 
 
-@dataclass
+@dataclass(slots=True)
 class IncomingMessage:
     """Normalized incoming message from any platform."""
     chat_id: str                              # Unique identifier for the chat/conversation
     chat_type: ChatType                       # Private or group
     user_id: str                              # User who sent the message
     text: str                                 # Message text content
-    images: list[tuple[str, str]] | None      # List of (base64_data, mime_type) tuples
+    images: list[tuple[bytes, str]] | None    # List of (base64_bytes, mime_type) tuples
     raw: dict                                 # Raw platform-specific message data
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class CardHandle:
     """Handle to an updatable card/message."""
     message_id: str                           # Platform-specific message ID
     chat_id: str                              # Chat where the card was sent
 
 
+class AdapterError(Exception):
+    """A send or update the platform could not complete (network, API, timeout)."""
+
+
 # Type alias for message callback
 MessageCallback = Callable[[IncomingMessage], None]
 
@@ -72,6 +76,9 @@ class ChatAdapter(ABC):
             
         Returns:
             Message ID if available, None otherwise
+            
+        Raises:
+            AdapterError: If the platform could not deliver the message
         """
         pass
 
@@ -100,6 +107,9 @@ class ChatAdapter(ABC):
             
         Returns:
             True if update succeeded, False otherwise
+            
+        Raises:
+            AdapterError: If the platform could not be reached
         """
         pass
 
@@ -2,15 +2,23 @@
 
 import asyncio
 import base64
+import concurrent.futures
+import functools
+import hashlib
 import logging
 import os
-import threading
+import random
+import re
+import time
+from pathlib import Path
 from typing import Any, Callable
 
+import aiohttp
 import discord
+import orjson
 from discord import Intents, Message, Embed, app_commands
 
-from .base import ChatAdapter, ChatType, IncomingMessage, CardHandle, MessageCallback
+from .base import AdapterError, ChatAdapter, ChatType, IncomingMessage, CardHandle, MessageCallback
 from config import DiscordPolicy
 
 log = logging.getLogger(__name__)
@@ -18,17 +26,103 @@ log = logging.getLogger(__name__)
 # Command handler type: (platform, chat_id, command, args) -> response text
 SlashCommandHandler = Callable[[str, str, str, str], str | None]
 
+# Values of IncomingMessage.raw["_platform"] and raw["channel_name"] for DMs
+# (module constants, so every message shares the same string objects)
+_PLATFORM = "discord"
+_DM_CHANNEL_NAME = "DM"
+
 # Message limits
 TEXT_CHUNK_LIMIT = 2000      # Discord's limit for regular messages
 EMBED_CHUNK_LIMIT = 4096     # Discord's limit for embed description
 MAX_LINES_PER_MESSAGE = 40   # Soft limit for readability
 
+# Backoff one _send_with_retry call can sleep with its defaults (3 attempts,
+# 1s base doubling, 30s cap); a 429 Retry-After may still exceed it
+_SEND_RETRY_BUDGET = sum(min(30.0, 1.0 * 2 ** i) for i in range(3))
+
+# Base wait for sync->async calls, plus a retry budget and request time per
+# message chunk sent, so a timeout only cancels sends that are really hung
+_RUN_ASYNC_TIMEOUT = 10.0
+_PER_CHUNK_TIMEOUT = _SEND_RETRY_BUDGET + 5.0
+
+# Delay before an unreferenced typing loop is cancelled, so back-to-back
+# turns in the same chat don't cancel and recreate it
+_TYPING_LINGER = 0.5
+
+# Max concurrent slash command handlers (see _handle_slash_interaction)
+_SLASH_WORKERS = 4
+
+# Last-synced slash command tree hash per application + scope, under the
+# user's cache dir (see _slash_hash_file and _sync_slash_commands)
+_SLASH_HASH_NAME = "discord_slash_hash"
+
+# Re-sync even an unchanged tree after this long, in case commands were
+# edited or deleted on Discord's side
+_SLASH_SYNC_MAX_AGE = 24 * 3600
+
+# Card fingerprints kept before the oldest is evicted
+_CARD_FINGERPRINTS_MAX = 256
+
+# Images at least this large are base64-encoded in a worker thread
+_B64_OFFLOAD_BYTES = 512 * 1024
+
+# First non-whitespace character (same notion of whitespace as str.lstrip)
+_NON_SPACE_RE = re.compile(r"\S")
+
+# Client-side rate limits (Discord: 5 messages / 5s per channel, 50 req/s global)
+_CHANNEL_BURST, _CHANNEL_RATE = 5, 1.0
+_GLOBAL_BURST, _GLOBAL_RATE = 50, 50.0
+_RATE_BUCKETS_MAX = 1024  # Channel buckets kept before full ones are pruned
+
+# Transient server errors worth retrying (besides 429)
+_RETRYABLE_STATUS = frozenset({500, 502, 503, 504})
+
+
+def _slash_settings() -> tuple[bool, tuple[str, ...], bool]:
+    """Slash command env settings: (enabled, guild IDs, force sync).
+    
+    Read when an adapter is created rather than at import, since .env is only
+    loaded by load_config() after this module has been imported.
+    """
+    enabled = os.getenv("DISCORD_SLASH_COMMANDS", "true").lower() == "true"
+    guild_ids = tuple(x.strip() for x in os.getenv("DISCORD_GUILD_ID", "").split(",") if x.strip())
+    force_sync = os.getenv("DISCORD_SLASH_FORCE_SYNC", "false").lower() == "true"
+    return enabled, guild_ids, force_sync
+
+
+def _slash_hash_file() -> Path:
+    """$XDG_CACHE_HOME/kirocli-chatbot-gateway/discord_slash_hash (~/.cache by default).
+    
+    Resolved on use, like _slash_settings, so an XDG_CACHE_HOME from .env
+    applies. Kept out of the install directory, which is often read-only.
+    """
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "kirocli-chatbot-gateway" / _SLASH_HASH_NAME
+
+
+def _is_image(attachment: discord.Attachment) -> bool:
+    """Whether an attachment is an image we can forward to Kiro."""
+    content_type = attachment.content_type
+    return bool(content_type) and content_type.startswith("image/")
+
+
+class _TypingLoop:
+    """A chat's shared typing task and the number of turns using it."""
+    
+    __slots__ = ("task", "refs", "linger")
+    
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.refs = 1
+        self.linger: asyncio.TimerHandle | None = None  # Pending cancel
+
 
 class DiscordAdapter(ChatAdapter):
     """Discord implementation of ChatAdapter using discord.py.
     
     Runs discord.py's async event loop in a dedicated thread.
-    Sync methods use run_coroutine_threadsafe to bridge to async.
+    Sync methods use run_coroutine_threadsafe to bridge to async, or a plain
+    create_task when already called from the loop thread.
     """
 
     def __init__(self, bot_token: str, policy: DiscordPolicy | None = None):
@@ -39,20 +133,35 @@ class DiscordAdapter(ChatAdapter):
         
         # Async loop and client (set in start)
         self._loop: asyncio.AbstractEventLoop | None = None
+        # run_coroutine_threadsafe bound to self._loop (set in start())
+        self._submit: Callable[[Any], concurrent.futures.Future] | None = None
         self._client: discord.Client | None = None
-        self._ready_event = threading.Event()
+        self._mention_re: re.Pattern | None = None  # Compiled in on_ready
         
         # Typing loop tasks: chat_id -> asyncio.Task
-        self._typing_tasks: dict[str, asyncio.Task] = {}
+        self._typing_tasks: dict[str, _TypingLoop] = {}
+        
+        # Last edited (content, title) hash per card message_id (see update_card)
+        self._card_fingerprints: dict[str, int] = {}
+        
+        # Resolved channels: chat_id -> channel (see _resolve_channel)
+        self._channel_cache: dict[str, discord.abc.Messageable] = {}
+        
+        # Rate limit token buckets (see _acquire): channel_id -> (tokens, last refill)
+        self._rate_buckets: dict[int, tuple[float, float]] = {}
+        self._global_bucket: tuple[float, float] = (_GLOBAL_BURST, time.monotonic())
+        
+        # Fire-and-forget tasks created from the loop thread (see _schedule)
+        self._background_tasks: set[asyncio.Task] = set()
         
         # Slash commands
         self._slash_handler: SlashCommandHandler | None = None
-        self._slash_enabled = os.getenv("DISCORD_SLASH_COMMANDS", "true").lower() == "true"
-        self._slash_guild_ids = [x.strip() for x in os.getenv("DISCORD_GUILD_ID", "").split(",") if x.strip()]
+        self._slash_enabled, self._slash_guild_ids, self._slash_force_sync = _slash_settings()
+        self._slash_executor: concurrent.futures.ThreadPoolExecutor | None = None
 
     @property
     def platform_name(self) -> str:
-        return "discord"
+        return _PLATFORM
 
     def set_slash_handler(self, handler: SlashCommandHandler) -> None:
         """Set handler for slash commands.
@@ -81,17 +190,22 @@ class DiscordAdapter(ChatAdapter):
         if self._slash_enabled:
             self._tree = app_commands.CommandTree(self._client)
             self._setup_slash_commands()
+            # Dedicated pool so a command burst can't tie up the loop's default
+            # executor (used by to_thread and DNS lookups)
+            self._slash_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_SLASH_WORKERS, thread_name_prefix="discord-slash")
         
         @self._client.event
         async def on_ready():
             log.info("[Discord] Logged in as %s (ID: %s)", 
                      self._client.user.name, self._client.user.id)
             
+            # <@id> and <@!id> (nickname) mentions of the bot, stripped from text
+            self._mention_re = re.compile(rf"<@!?{self._client.user.id}>")
+            
             # Sync slash commands on ready
             if self._slash_enabled:
                 await self._sync_slash_commands()
-            
-            self._ready_event.set()
         
         @self._client.event
         async def on_message(message: Message):
@@ -100,6 +214,11 @@ class DiscordAdapter(ChatAdapter):
         # Run the client (blocking)
         log.info("[Discord] Starting bot...")
         self._loop = asyncio.new_event_loop()
+        self._submit = functools.partial(asyncio.run_coroutine_threadsafe, loop=self._loop)
+        if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+            # Most tasks here (typing start/stop, short sends) finish or block
+            # on I/O right away; eager tasks skip the extra scheduler hop
+            self._loop.set_task_factory(asyncio.eager_task_factory)
         asyncio.set_event_loop(self._loop)
         
         try:
@@ -118,51 +237,145 @@ class DiscordAdapter(ChatAdapter):
         if self._client and self._loop and not self._loop.is_closed():
             # Schedule close from potentially different thread
             asyncio.run_coroutine_threadsafe(self._client.close(), self._loop)
+        if self._slash_executor:
+            self._slash_executor.shutdown(wait=False, cancel_futures=True)
         log.info("[Discord] Adapter stop requested")
 
-    def _run_async(self, coro) -> Any:
-        """Run async coroutine from sync context."""
-        if not self._loop or self._loop.is_closed():
-            log.error("[Discord] Event loop not available")
+    def _on_loop_thread(self) -> bool:
+        """Whether the caller is running inside the adapter's event loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _schedule(self, coro) -> None:
+        """Schedule a coroutine on the event loop without waiting for it.
+        
+        From the loop thread itself (e.g. the message callback) this is a plain
+        create_task; from other threads it goes through run_coroutine_threadsafe.
+        """
+        if self._on_loop_thread():
+            task = self._loop.create_task(coro)
+            # Keep a strong reference until done (the loop only holds weak ones)
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        elif self._submit and not self._loop.is_closed():
+            self._submit(coro)
+        else:
+            coro.close()
+
+    def _run_async(self, coro, timeout: float = _RUN_ASYNC_TIMEOUT) -> Any:
+        """Run async coroutine from sync context.
+        
+        Network/API failures, timeouts and cancellation raise AdapterError so
+        the caller can decide how to recover; a timed-out coroutine is
+        cancelled. Any other exception is a bug and propagates unchanged.
+        """
+        if not self._submit or self._loop.is_closed():
+            coro.close()
+            raise AdapterError("Discord event loop not available")
+        
+        if self._on_loop_thread():
+            # Blocking on the result here would deadlock the loop; run it in
+            # the background instead (the result is unavailable to the caller)
+            log.warning("[Discord] Sync call from event loop thread, scheduling without waiting")
+            self._schedule(coro)
             return None
         
-        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future = self._submit(coro)
         try:
-            return future.result(timeout=30)
-        except Exception as e:
-            log.error("[Discord] Async call failed: %s", e)
-            return None
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise AdapterError(f"Discord call timed out after {timeout:.0f}s") from None
+        except concurrent.futures.CancelledError:
+            raise AdapterError("Discord call cancelled (shutting down?)") from None
+        except (discord.HTTPException, aiohttp.ClientError) as e:
+            raise AdapterError(f"Discord call failed: {e}") from e
+
+    async def _acquire(self, channel_id: int) -> None:
+        """Wait for a send slot under the client-side rate limits.
+        
+        Token buckets sized to Discord's published limits (per channel and
+        global) gate requests before they go out, so 429s become rare instead
+        of being discovered one wasted round trip at a time. Only touched from
+        the loop thread, so no locking is needed.
+        """
+        buckets = self._rate_buckets
+        if channel_id not in buckets and len(buckets) >= _RATE_BUCKETS_MAX:
+            self._prune_rate_buckets()
+        while True:
+            now = time.monotonic()
+            tokens, last = buckets.get(channel_id, (_CHANNEL_BURST, now))
+            tokens = min(_CHANNEL_BURST, tokens + (now - last) * _CHANNEL_RATE)
+            g_tokens, g_last = self._global_bucket
+            g_tokens = min(_GLOBAL_BURST, g_tokens + (now - g_last) * _GLOBAL_RATE)
+            
+            if tokens >= 1 and g_tokens >= 1:
+                buckets[channel_id] = (tokens - 1, now)
+                self._global_bucket = (g_tokens - 1, now)
+                return
+            
+            buckets[channel_id] = (tokens, now)
+            self._global_bucket = (g_tokens, now)
+            await asyncio.sleep(max((1 - tokens) / _CHANNEL_RATE, (1 - g_tokens) / _GLOBAL_RATE))
 
-    async def _send_with_retry(self, coro_func, *args, max_retries: int = 3, **kwargs):
-        """Execute a coroutine with retry on rate limit.
+    def _prune_rate_buckets(self) -> None:
+        """Drop channel buckets that have refilled completely (same as absent)."""
+        now = time.monotonic()
+        full = _CHANNEL_BURST / _CHANNEL_RATE
+        for key in [k for k, (_, t) in self._rate_buckets.items() if now - t >= full]:
+            del self._rate_buckets[key]
+
+    async def _send_with_retry(self, coro_func, *args, max_retries: int = 3,
+                               base_delay: float = 1.0, max_delay: float = 30.0,
+                               rate_key: int | None = None, **kwargs):
+        """Execute a coroutine with retry on rate limit and transient server errors.
+        
+        Uses exponential backoff with full jitter so concurrent senders that hit
+        the same limit don't all wake up at once. On 429 the delay is never
+        shorter than Discord's Retry-After.
         
         Args:
             coro_func: Async function to call (not the coroutine itself)
             *args, **kwargs: Arguments to pass to coro_func
             max_retries: Maximum number of retry attempts
+            base_delay: Backoff base in seconds
+            max_delay: Backoff cap in seconds
+            rate_key: Channel ID to admit each attempt through _acquire()
         
         Returns:
             Result of the coroutine, or raises on persistent failure
         """
         last_error = None
         for attempt in range(max_retries):
+            if rate_key is not None:
+                await self._acquire(rate_key)
             try:
                 return await coro_func(*args, **kwargs)
             except discord.HTTPException as e:
                 last_error = e
+                backoff = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
                 if e.status == 429:  # Rate limited
                     retry_after = getattr(e, 'retry_after', None) or 1.0
+                    delay = max(retry_after, backoff)
                     log.warning(
                         "[Discord] Rate limited (attempt %d/%d), retry in %.1fs",
-                        attempt + 1, max_retries, retry_after
+                        attempt + 1, max_retries, delay
+                    )
+                elif e.status in _RETRYABLE_STATUS:
+                    delay = backoff
+                    log.warning(
+                        "[Discord] Server error %d (attempt %d/%d), retry in %.1fs",
+                        e.status, attempt + 1, max_retries, delay
                     )
-                    await asyncio.sleep(retry_after)
                 else:
-                    # Non-rate-limit error, don't retry
+                    # Other client errors, don't retry
                     raise
+                await asyncio.sleep(delay)
         
         # All retries exhausted
-        log.error("[Discord] Max retries exceeded for rate limit")
+        log.error("[Discord] Max retries exceeded (last status %s)", last_error.status)
         raise last_error
 
     def _split_text(self, text: str, max_len: int = TEXT_CHUNK_LIMIT) -> list[str]:
@@ -172,68 +385,112 @@ class DiscordAdapter(ChatAdapter):
         1. Blank lines (paragraph boundaries)
         2. Newlines
         3. Character limit (last resort)
+        
+        Walks a start offset through the original string and uses bounded
+        rfind() windows, so no shrinking copy of the remaining text is made
+        per chunk (linear in len(text) overall). Split points in the first
+        half of a chunk are rejected anyway, so only the second half of each
+        window is searched.
         """
         if len(text) <= max_len:
             return [text]
         
         chunks = []
-        remaining = text
-        
-        while remaining:
-            if len(remaining) <= max_len:
-                chunks.append(remaining)
+        n = len(text)
+        start = 0
+        half = max_len // 2
+        
+        while start < n:
+            end = start + max_len
+            if n <= end:
+                chunks.append(text[start:])
                 break
             
-            # Try to find a good split point
-            split_at = max_len
+            # Try to find a good split point (only if reasonably far in)
+            split_at = end
+            lo = start + half + 1
             
             # Look for blank line (paragraph break) within limit
-            blank_line_pos = remaining.rfind('\n\n', 0, max_len)
-            if blank_line_pos > max_len // 2:  # Only use if reasonably far in
-                split_at = blank_line_pos + 1
-            else:
+            pos = text.rfind('\n\n', lo, end)
+            if pos < 0:
                 # Look for any newline
-                newline_pos = remaining.rfind('\n', 0, max_len)
-                if newline_pos > max_len // 2:
-                    split_at = newline_pos + 1
-                else:
+                pos = text.rfind('\n', lo, end)
+                if pos < 0:
                     # Look for space
-                    space_pos = remaining.rfind(' ', 0, max_len)
-                    if space_pos > max_len // 2:
-                        split_at = space_pos + 1
+                    pos = text.rfind(' ', lo, end)
+            if pos >= 0:
+                split_at = pos + 1
             
-            chunks.append(remaining[:split_at].rstrip())
-            remaining = remaining[split_at:].lstrip()
+            chunks.append(text[start:split_at].rstrip())
+            # Skip leading whitespace of the next chunk
+            m = _NON_SPACE_RE.search(text, split_at)
+            start = m.start() if m else n
         
         return chunks
 
+    async def _resolve_channel(self, chat_id: str) -> discord.abc.Messageable | None:
+        """Resolve a chat_id to a channel, memoized for the adapter's lifetime.
+        
+        Falls back to fetch_channel (HTTP) for channels not in discord.py's
+        cache, e.g. threads; the result is cached so that happens once.
+        """
+        channel = self._channel_cache.get(chat_id)
+        if channel is not None:
+            return channel
+        
+        channel_id = int(chat_id)
+        channel = self._client.get_channel(channel_id)
+        if not channel:
+            try:
+                channel = await self._client.fetch_channel(channel_id)
+            except discord.NotFound:
+                log.error("[Discord] Channel not found: %s", chat_id)
+                return None
+            except discord.Forbidden:
+                log.error("[Discord] No permission to access channel: %s", chat_id)
+                return None
+        self._channel_cache[chat_id] = channel
+        return channel
+
+    def _forget_channel_on(self, error: Exception, chat_id: str) -> None:
+        """Drop a cached channel after NotFound/Forbidden so it is re-resolved."""
+        if isinstance(error, (discord.NotFound, discord.Forbidden)):
+            self._channel_cache.pop(chat_id, None)
+
+    async def _send_chunks(self, channel, chat_id: str, chunks: list[str], first: int = 0) -> tuple[str | None, bool]:
+        """Send chunks[first:] to a channel in order, stopping at the first failure.
+        
+        Chunks are deliberately sent one after another: Discord does not
+        order concurrently posted messages, and a split reply must read top
+        to bottom. Returns the ID of the last message sent, if any, and
+        whether every chunk went out.
+        """
+        total = len(chunks)
+        last_msg_id = None
+        for i in range(first, total):
+            try:
+                msg = await self._send_with_retry(channel.send, chunks[i], rate_key=channel.id)
+            except discord.HTTPException as e:
+                log.error("[Discord] Failed to send chunk %d/%d: %s", i + 1, total, e)
+                self._forget_channel_on(e, chat_id)
+                return last_msg_id, False
+            last_msg_id = str(msg.id)
+            if total > 1:
+                log.debug("[Discord] Sent chunk %d/%d", i + 1, total)
+        return last_msg_id, True
+
     def send_text(self, chat_id: str, text: str) -> str | None:
         """Send a plain text message, splitting into chunks if needed."""
         async def _send():
-            channel = self._client.get_channel(int(chat_id))
+            channel = await self._resolve_channel(chat_id)
             if not channel:
-                try:
-                    channel = await self._client.fetch_channel(int(chat_id))
-                except discord.NotFound:
-                    log.error("[Discord] Channel not found: %s", chat_id)
-                    return None
-            
-            chunks = self._split_text(text, TEXT_CHUNK_LIMIT)
-            last_msg_id = None
-            
-            for i, chunk in enumerate(chunks):
-                try:
-                    msg = await self._send_with_retry(channel.send, chunk)
-                    last_msg_id = str(msg.id)
-                    if len(chunks) > 1:
-                        log.debug("[Discord] Sent chunk %d/%d", i + 1, len(chunks))
-                except discord.HTTPException as e:
-                    log.error("[Discord] Failed to send chunk %d: %s", i + 1, e)
-                    break
+                return None
             
+            last_msg_id, _ = await self._send_chunks(channel, chat_id, chunks)
             return last_msg_id
         
-        return self._run_async(_send())
+        chunks = self._split_text(text, TEXT_CHUNK_LIMIT)
+        return self._run_async(_send(), timeout=_RUN_ASYNC_TIMEOUT + _PER_CHUNK_TIMEOUT * len(chunks))
 
     def send_text_nowait(self, chat_id: str, text: str) -> None:
         """Send a text message without blocking the event loop.
@@ -241,26 +498,14 @@ class DiscordAdapter(ChatAdapter):
         Use this for command responses to avoid blocking Discord's heartbeat.
         """
         async def _send():
-            channel = self._client.get_channel(int(chat_id))
+            channel = await self._resolve_channel(chat_id)
             if not channel:
-                try:
-                    channel = await self._client.fetch_channel(int(chat_id))
-                except discord.NotFound:
-                    log.error("[Discord] Channel not found: %s", chat_id)
-                    return
+                return
             
             chunks = self._split_text(text, TEXT_CHUNK_LIMIT)
-            for i, chunk in enumerate(chunks):
-                try:
-                    await self._send_with_retry(channel.send, chunk)
-                    if len(chunks) > 1:
-                        log.debug("[Discord] Sent chunk %d/%d (nowait)", i + 1, len(chunks))
-                except discord.HTTPException as e:
-                    log.error("[Discord] Failed to send chunk %d: %s", i + 1, e)
-                    break
-        
-        if self._loop and not self._loop.is_closed():
-            asyncio.run_coroutine_threadsafe(_send(), self._loop)
+            await self._send_chunks(channel, chat_id, chunks)
+        
+        self._schedule(_send())
 
     def send_card(self, chat_id: str, content: str, title: str = "") -> CardHandle | None:
         """Discord doesn't use updatable card embeds for responses.
@@ -281,72 +526,77 @@ class DiscordAdapter(ChatAdapter):
             log.warning("[Discord] Cannot update card: no handle")
             return False
         
+        # Unchanged since the last successful edit (e.g. a no-op streaming
+        # tick): skip the fetch, the edit and its rate limit slot
+        fingerprint = hash((content, title))
+        if self._card_fingerprints.get(handle.message_id) == fingerprint:
+            return True
+        
         async def _update():
-            channel = self._client.get_channel(int(handle.chat_id))
+            channel = await self._resolve_channel(handle.chat_id)
             if not channel:
-                try:
-                    channel = await self._client.fetch_channel(int(handle.chat_id))
-                except discord.NotFound:
-                    log.error("[Discord] Channel not found: %s", handle.chat_id)
-                    return False
+                return False
             
             try:
                 msg = await channel.fetch_message(int(handle.message_id))
             except discord.NotFound:
                 log.error("[Discord] Message not found: %s", handle.message_id)
                 return False
-            except discord.Forbidden:
+            except discord.Forbidden as e:
                 log.error("[Discord] No permission to access message: %s", handle.message_id)
+                self._forget_channel_on(e, handle.chat_id)
                 return False
             
-            # Split content for embed
-            chunks = self._split_text(content, EMBED_CHUNK_LIMIT)
-            
             # Update original message with first chunk
             try:
                 embed = self._build_embed(chunks[0], title)
-                await self._send_with_retry(msg.edit, embed=embed)
+                await self._send_with_retry(msg.edit, embed=embed, rate_key=msg.channel.id)
                 log.info("[Discord] Card updated: %s", handle.message_id)
+                fingerprints = self._card_fingerprints
+                fingerprints.pop(handle.message_id, None)
             except discord.Forbidden:
                 log.error("[Discord] No permission to edit message: %s", handle.message_id)
                 return False
             
             # Send remaining chunks as new messages
+            # (plain text for continuation, cleaner than multiple embeds)
             if len(chunks) > 1:
-                for i, chunk in enumerate(chunks[1:], start=2):
-                    try:
-                        # Send as plain text for continuation (cleaner than multiple embeds)
-                        await self._send_with_retry(channel.send, chunk)
-                        log.debug("[Discord] Sent continuation %d/%d", i, len(chunks))
-                    except discord.HTTPException as e:
-                        log.error("[Discord] Failed to send continuation %d: %s", i, e)
-                        break
+                _, complete = await self._send_chunks(channel, handle.chat_id, chunks, first=1)
+                if not complete:
+                    # Leave no fingerprint so a retry resends the missing tail
+                    return True
             
+            if len(fingerprints) >= _CARD_FINGERPRINTS_MAX:
+                del fingerprints[next(iter(fingerprints))]  # Oldest edit
+            fingerprints[handle.message_id] = fingerprint
             return True
         
-        result = self._run_async(_update())
+        # Split content for embed
+        chunks = self._split_text(content, EMBED_CHUNK_LIMIT)
+        result = self._run_async(_update(), timeout=_RUN_ASYNC_TIMEOUT + _PER_CHUNK_TIMEOUT * len(chunks))
         return result if result else False
 
     def send_typing(self, chat_id: str) -> None:
         """Send typing indicator."""
         async def _typing():
-            channel = self._client.get_channel(int(chat_id))
+            channel = await self._resolve_channel(chat_id)
             if channel:
                 await channel.typing()
         
-        if self._loop and not self._loop.is_closed():
-            asyncio.run_coroutine_threadsafe(_typing(), self._loop)
+        self._schedule(_typing())
 
     def start_typing_loop(self, chat_id: str) -> None:
         """Start a background loop that sends typing indicators every 8 seconds.
         
         Discord typing indicator lasts ~10 seconds, so we refresh every 8s.
+        Calls are reference counted per chat: overlapping turns share one loop,
+        and a stop followed by a start within _TYPING_LINGER reuses it.
         """
         async def _typing_loop():
             try:
-                channel = self._client.get_channel(int(chat_id))
+                channel = await self._resolve_channel(chat_id)
                 if not channel:
-                    channel = await self._client.fetch_channel(int(chat_id))
+                    return
                 
                 while True:
                     await channel.typing()
@@ -357,27 +607,44 @@ class DiscordAdapter(ChatAdapter):
                 log.debug("[Discord] Typing loop error for %s: %s", chat_id, e)
         
         async def _start():
-            # Cancel existing task if any
-            if chat_id in self._typing_tasks:
-                self._typing_tasks[chat_id].cancel()
+            entry = self._typing_tasks.get(chat_id)
+            refs = 0
+            if entry:
+                if entry.linger:
+                    # Restarted before the pending cancel fired
+                    entry.linger.cancel()
+                    entry.linger = None
+                if not entry.task.done():
+                    entry.refs += 1
+                    return
+                # The loop ended on its own (e.g. an HTTP error) while turns may
+                # still hold it; they keep their references on the replacement
+                refs = max(entry.refs, 0)
             
-            task = asyncio.create_task(_typing_loop())
-            self._typing_tasks[chat_id] = task
+            new_entry = _TypingLoop(asyncio.create_task(_typing_loop()))
+            new_entry.refs += refs
+            self._typing_tasks[chat_id] = new_entry
             log.debug("[Discord] Started typing loop for %s", chat_id)
         
-        if self._loop and not self._loop.is_closed():
-            asyncio.run_coroutine_threadsafe(_start(), self._loop)
+        self._schedule(_start())
 
     def stop_typing_loop(self, chat_id: str) -> None:
-        """Stop the typing indicator loop for a chat."""
-        async def _stop():
-            if chat_id in self._typing_tasks:
-                self._typing_tasks[chat_id].cancel()
+        """Stop the typing indicator loop for a chat once no turn needs it."""
+        def _cancel(entry: _TypingLoop):
+            if self._typing_tasks.get(chat_id) is entry:
                 del self._typing_tasks[chat_id]
-                log.debug("[Discord] Stopped typing loop for %s", chat_id)
+            entry.task.cancel()
+            log.debug("[Discord] Stopped typing loop for %s", chat_id)
         
-        if self._loop and not self._loop.is_closed():
-            asyncio.run_coroutine_threadsafe(_stop(), self._loop)
+        async def _stop():
+            entry = self._typing_tasks.get(chat_id)
+            if not entry:
+                return
+            entry.refs -= 1
+            if entry.refs <= 0 and not entry.linger:
+                entry.linger = self._loop.call_later(_TYPING_LINGER, _cancel, entry)
+        
+        self._schedule(_stop())
 
     def _build_embed(self, content: str, title: str = "") -> Embed:
         """Build a Discord embed from markdown content."""
@@ -386,15 +653,19 @@ class DiscordAdapter(ChatAdapter):
             embed.title = title
         return embed
 
-    async def _download_attachment(self, attachment: discord.Attachment) -> tuple[str, str] | None:
-        """Download attachment and return (base64_data, mime_type)."""
+    async def _download_attachment(self, attachment: discord.Attachment) -> tuple[bytes, str] | None:
+        """Download attachment and return (base64_bytes, mime_type)."""
         try:
             # Only handle images
-            if not attachment.content_type or not attachment.content_type.startswith("image/"):
+            if not _is_image(attachment):
                 return None
             
             data = await attachment.read()
-            b64 = base64.b64encode(data).decode("ascii")
+            if len(data) >= _B64_OFFLOAD_BYTES:
+                # Large image: encode off the event loop so heartbeats keep flowing
+                b64 = await asyncio.to_thread(base64.b64encode, data)
+            else:
+                b64 = base64.b64encode(data)
             mime = attachment.content_type.split(";")[0]  # Remove charset if present
             log.info("[Discord] Downloaded attachment: %d bytes, %s", len(data), mime)
             return (b64, mime)
@@ -415,12 +686,15 @@ class DiscordAdapter(ChatAdapter):
         if message.author.bot and not self._policy.allow_bots:
             return
         
-        user_id = str(message.author.id)
+        channel = message.channel
+        mentioned = None  # Computed lazily; reused for raw["mentions_bot"]
         
         # Determine chat type and check access
-        if isinstance(message.channel, discord.DMChannel):
+        if isinstance(channel, discord.DMChannel):
             chat_type = ChatType.PRIVATE
-            chat_id = str(message.channel.id)
+            user_id = str(message.author.id)
+            chat_id = str(channel.id)
+            guild_id = None
             
             # Check DM access policy
             allowed, reason = self._policy.check_dm_access(user_id)
@@ -428,24 +702,25 @@ class DiscordAdapter(ChatAdapter):
                 log.info("[Discord] DM denied for user %s: %s", user_id, reason)
                 return
             
-        elif isinstance(message.channel, (discord.TextChannel, discord.Thread)):
+        elif isinstance(channel, (discord.TextChannel, discord.Thread)):
+            # Cheapest, most selective filter first: most guild traffic doesn't
+            # mention the bot, so reject it before the access checks
+            guild_id = str(message.guild.id) if message.guild else None
+            chat_id = str(channel.id)
+            if self._policy.get_require_mention(guild_id or "", chat_id):
+                mentioned = self._client.user.mentioned_in(message) if self._client.user else False
+                if not mentioned:
+                    return  # Silently ignore (no log, too noisy)
+            
             chat_type = ChatType.GROUP
-            chat_id = str(message.channel.id)
-            guild_id = str(message.guild.id) if message.guild else ""
+            user_id = str(message.author.id)
             
             # Check guild access policy
-            allowed, reason = self._policy.check_guild_access(guild_id, chat_id, user_id)
+            allowed, reason = self._policy.check_guild_access(guild_id or "", chat_id, user_id)
             if not allowed:
                 log.debug("[Discord] Guild access denied for %s/%s/%s: %s", 
                          guild_id, chat_id, user_id, reason)
                 return
-            
-            # Check if mention is required
-            require_mention = self._policy.get_require_mention(guild_id, chat_id)
-            mentioned = self._client.user.mentioned_in(message) if self._client.user else False
-            
-            if require_mention and not mentioned:
-                return  # Silently ignore (no log, too noisy)
                 
         else:
             # Ignore other channel types (voice, stage, etc.)
@@ -454,18 +729,19 @@ class DiscordAdapter(ChatAdapter):
         # Extract text
         text = message.content
         
-        # Remove bot mention from text
-        if self._client.user:
-            text = text.replace(f"<@{self._client.user.id}>", "").strip()
-            text = text.replace(f"<@!{self._client.user.id}>", "").strip()  # Nickname mention
+        # Remove bot mention from text (plain and nickname form, one pass)
+        if self._mention_re is None and self._client.user:
+            # Message dispatched before on_ready
+            self._mention_re = re.compile(rf"<@!?{self._client.user.id}>")
+        if self._mention_re:
+            text = self._mention_re.sub("", text).strip()
         
-        # Handle images
+        # Handle images (downloaded concurrently, order preserved by gather)
         images = []
-        for attachment in message.attachments:
-            if attachment.content_type and attachment.content_type.startswith("image/"):
-                img_data = await self._download_attachment(attachment)
-                if img_data:
-                    images.append(img_data)
+        image_attachments = [a for a in message.attachments if _is_image(a)]
+        if image_attachments:
+            results = await asyncio.gather(*(self._download_attachment(a) for a in image_attachments))
+            images = [r for r in results if r]
         
         # Also check embeds for images (e.g., linked images)
         for embed in message.embeds:
@@ -479,8 +755,9 @@ class DiscordAdapter(ChatAdapter):
         log.info("[Discord] Message from %s in %s: text=%s, images=%d",
                  message.author.name, chat_id, text[:50] if text else "(none)", len(images))
         
-        # Check if bot was mentioned (for raw data)
-        mentions_bot = self._client.user.mentioned_in(message) if self._client.user else False
+        # Check if bot was mentioned (for raw data), unless already known
+        if mentioned is None:
+            mentioned = self._client.user.mentioned_in(message) if self._client.user else False
         
         # Create normalized message
         incoming = IncomingMessage(
@@ -490,11 +767,11 @@ class DiscordAdapter(ChatAdapter):
             text=text,
             images=images if images else None,
             raw={
-                "_platform": "discord",
+                "_platform": _PLATFORM,
                 "message_id": str(message.id),
-                "mentions_bot": mentions_bot,
-                "guild_id": str(message.guild.id) if message.guild else None,
-                "channel_name": getattr(message.channel, "name", "DM"),
+                "mentions_bot": mentioned,
+                "guild_id": guild_id,
+                "channel_name": channel.name if chat_type is ChatType.GROUP else _DM_CHANNEL_NAME,
             },
         )
         
@@ -524,27 +801,112 @@ class DiscordAdapter(ChatAdapter):
         
         log.info("[Discord] Slash commands defined: /help, /agent, /model")
     
+    def _slash_tree_hash(self) -> str:
+        """Content hash of the command payloads a sync would upload.
+        
+        Built from each command's to_dict(), so options, choices, default
+        permissions etc. all count, not just names and descriptions.
+        """
+        payloads = []
+        for cmd in self._tree.get_commands():
+            try:
+                payloads.append(cmd.to_dict(self._tree))  # discord.py >= 2.4
+            except TypeError:
+                payloads.append(cmd.to_dict())
+        payloads.sort(key=lambda p: p.get("name", ""))
+        data = orjson.dumps(payloads, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _load_slash_hashes() -> dict[str, tuple[str, float]]:
+        """Read the last syncs ("<app_id>:<scope> <hash> <unix time>" per line)."""
+        hashes = {}
+        try:
+            with open(_slash_hash_file(), "r", encoding="utf-8") as f:
+                for line in f.read().splitlines():
+                    fields = line.split()
+                    if len(fields) == 3:
+                        try:
+                            hashes[fields[0]] = (fields[1], float(fields[2]))
+                        except ValueError:
+                            continue
+        except OSError:
+            pass
+        return hashes
+
+    @staticmethod
+    def _save_slash_hashes(hashes: dict[str, tuple[str, float]]) -> None:
+        path = _slash_hash_file()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                "".join(f"{scope} {h} {t:.0f}\n" for scope, (h, t) in hashes.items()),
+                encoding="utf-8")
+        except OSError as e:
+            log.warning("[Discord] Could not save slash command hash (will re-sync next start): %s", e)
+
     async def _sync_slash_commands(self):
         """Sync slash commands with Discord API.
         
         Always syncs globally (for DM access).
         Additionally syncs to specific guilds for instant availability.
         Global sync can take up to 1 hour to propagate.
+        
+        Scopes whose command tree hash matches a sync of the same application
+        within _SLASH_SYNC_MAX_AGE are skipped (unless DISCORD_SLASH_FORCE_SYNC
+        is set); the remaining guild syncs run concurrently.
         """
+        app_id = self._client.application_id or (self._client.user.id if self._client.user else 0)
+        cmd_hash = self._slash_tree_hash()
+        hashes = self._load_slash_hashes()
+        now = time.time()
+        changed = False
+        
+        def up_to_date(scope: str) -> bool:
+            if self._slash_force_sync:
+                return False
+            last = hashes.get(scope)
+            return last is not None and last[0] == cmd_hash and now - last[1] < _SLASH_SYNC_MAX_AGE
+        
         try:
             # Global sync (needed for DM access)
-            synced = await self._tree.sync()
-            log.info("[Discord] Synced %d slash commands globally", len(synced))
+            scope = f"{app_id}:global"
+            if up_to_date(scope):
+                log.info("[Discord] Global slash commands unchanged, skipping sync")
+            else:
+                synced = await self._tree.sync()
+                log.info("[Discord] Synced %d slash commands globally", len(synced))
+                hashes[scope] = (cmd_hash, now)
+                changed = True
             
             # Guild-specific sync (instant availability in servers)
+            pending = []
             for gid in self._slash_guild_ids:
+                scope = f"{app_id}:{gid}"
+                if up_to_date(scope):
+                    log.info("[Discord] Slash commands unchanged for guild %s, skipping sync", gid)
+                    continue
                 guild = discord.Object(id=int(gid))
                 self._tree.copy_global_to(guild=guild)
-                synced = await self._tree.sync(guild=guild)
+                pending.append((gid, scope, guild))
+            
+            results = await asyncio.gather(
+                *(self._tree.sync(guild=guild) for _, _, guild in pending),
+                return_exceptions=True,
+            )
+            for (gid, scope, _), result in zip(pending, results):
+                if isinstance(result, BaseException):
+                    log.error("[Discord] Failed to sync slash commands to guild %s: %s", gid, result)
+                    continue
                 log.info("[Discord] Synced %d slash commands to guild %s", 
-                         len(synced), gid)
+                         len(result), gid)
+                hashes[scope] = (cmd_hash, now)
+                changed = True
         except Exception as e:
             log.error("[Discord] Failed to sync slash commands: %s", e)
+        
+        if changed:
+            self._save_slash_hashes(hashes)
     
     async def _handle_slash_interaction(self, interaction: discord.Interaction, 
                                         cmd: str, args: str):
@@ -562,9 +924,9 @@ class DiscordAdapter(ChatAdapter):
             # Call the handler (runs in executor to not block)
             loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
-                None, 
+                self._slash_executor, 
                 self._slash_handler, 
-                "discord", chat_id, cmd, args
+                _PLATFORM, chat_id, cmd, args
             )
             
             if response:
@@ -577,6 +939,7 @@ class DiscordAdapter(ChatAdapter):
                         # Send additional chunks as new messages
                         channel = interaction.channel
                         if channel:
+                            await self._acquire(channel.id)
                             await channel.send(chunk)
             else:
                 await interaction.followup.send("✓ Done")
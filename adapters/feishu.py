@@ -1,10 +1,13 @@
 """Feishu (Lark) chat adapter implementation."""
 
-import base64
-import json
+import binascii
 import logging
+import queue
+import re
+import threading
 
 import lark_oapi as lark
+import orjson
 from lark_oapi.api.im.v1 import (
     CreateMessageRequest,
     CreateMessageRequestBody,
@@ -19,6 +22,106 @@ from .base import ChatAdapter, ChatType, IncomingMessage, CardHandle, MessageCal
 
 log = logging.getLogger(__name__)
 
+# Value of IncomingMessage.raw["_platform"]
+_PLATFORM = "feishu"
+
+# Feishu chat_type -> ChatType (anything else is treated as a group)
+_CHAT_TYPES = {"p2p": ChatType.PRIVATE, "group": ChatType.GROUP}
+
+# Image magic bytes -> MIME type (WEBP needs two fields, see _sniff_mime)
+_MIME_BY_PREFIX = {
+    b'\x89PNG\r\n\x1a\n': "image/png",
+    b'GIF87a': "image/gif",
+    b'GIF89a': "image/gif",
+    b'\xff\xd8': "image/jpeg",
+}
+_PREFIX_LENGTHS = sorted({len(p) for p in _MIME_BY_PREFIX}, reverse=True)
+
+# A fenced code block: opening ```, the rest of its line (language), then the
+# code up to the closing ``` (or the end of text, for an unterminated fence)
+_FENCE_RE = re.compile(r"```((?:[^\n`]|`(?!``))*)(?:\n(.*?))?(?:```|\Z)", re.DOTALL)
+
+
+def _sniff_mime(data: bytes) -> str:
+    """Detect an image's MIME type from its magic bytes (PNG if unknown)."""
+    for length in _PREFIX_LENGTHS:
+        mime = _MIME_BY_PREFIX.get(data[:length])
+        if mime:
+            return mime
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return "image/webp"
+    return "image/png"
+
+
+def _apply_mentions(text: str, bot_keys: list[str], mention_map: dict[str, str]) -> str:
+    """Replace mention placeholders: drop the bot's, substitute the rest.
+    
+    Several placeholders are replaced in one regex pass over the text;
+    longer keys are tried first so "@_user_1" can't clobber "@_user_10".
+    """
+    if len(bot_keys) + len(mention_map) < 2:
+        for key in bot_keys:
+            text = text.replace(key, "")
+        for key, name in mention_map.items():
+            text = text.replace(key, name)
+        return text.strip()
+    
+    replacements = dict.fromkeys(bot_keys, "")
+    replacements.update(mention_map)
+    pattern = re.compile("|".join(map(re.escape, sorted(replacements, key=len, reverse=True))))
+    return pattern.sub(lambda m: replacements[m.group(0)], text).strip()
+
+
+def _card_json(card: dict) -> str:
+    """Serialize a card for a request body's content field.
+    
+    The SDK models content as str and JSON-encodes the whole request body
+    itself, so the UTF-8 bytes from orjson have to be decoded here; passing
+    bytes through would fail at request serialization.
+    """
+    return orjson.dumps(card).decode()
+
+
+def _post_elements(content: dict):
+    """Yield every element dict of a post message, across languages and lines."""
+    for lang_content in content.values():
+        if not isinstance(lang_content, dict):
+            continue
+        for item in lang_content.get("content", ()):
+            if not isinstance(item, list):
+                continue
+            for elem in item:
+                if isinstance(elem, dict):
+                    yield elem
+
+
+def _post_text(adapter: "FeishuAdapter", message_id: str, elem: dict, parts: list, images: list) -> None:
+    parts.append(elem.get("text", ""))
+
+
+def _post_img(adapter: "FeishuAdapter", message_id: str, elem: dict, parts: list, images: list) -> None:
+    image_key = elem.get("image_key", "")
+    if image_key:
+        img_data = adapter._download_image(message_id, image_key)
+        if img_data:
+            images.append(img_data)
+
+
+# Post element tag -> handler; other tags (links, @mentions, ...) are ignored
+_POST_HANDLERS = {"text": _post_text, "img": _post_img}
+
+
+class _ParkedUpdate:
+    """Card content waiting behind an in-flight PATCH, and how it went."""
+    
+    __slots__ = ("content", "title", "done", "ok")
+    
+    def __init__(self, content: str, title: str):
+        self.content = content
+        self.title = title
+        self.done = threading.Event()  # Set once the PATCH carrying it returns
+        self.ok = False
+
 
 class FeishuAdapter(ChatAdapter):
     """Feishu (Lark) implementation of ChatAdapter."""
@@ -31,19 +134,34 @@ class FeishuAdapter(ChatAdapter):
         self._client = lark.Client.builder().app_id(app_id).app_secret(app_secret).build()
         self._ws_client = None
         self._running = False
+        
+        # message_id -> latest parked update while a PATCH for that card is
+        # in flight, None if nothing is parked (see update_card)
+        self._card_pending: dict[str, _ParkedUpdate | None] = {}
+        self._card_lock = threading.Lock()
+        
+        # Received events waiting for the worker (see _event_loop); None stops it
+        self._events: queue.SimpleQueue[P2ImMessageReceiveV1 | None] = queue.SimpleQueue()
+        self._event_worker: threading.Thread | None = None
 
     @property
     def platform_name(self) -> str:
-        return "feishu"
+        return _PLATFORM
 
     def start(self, message_callback: MessageCallback) -> None:
         """Start WebSocket connection (blocking)."""
         self._message_callback = message_callback
         self._running = True
         
+        # The SDK calls the handler on its WebSocket loop; hand events to a
+        # worker so image downloads and callbacks don't stall the connection
+        self._event_worker = threading.Thread(
+            target=self._event_loop, name="feishu-events", daemon=True)
+        self._event_worker.start()
+        
         event_handler = (
             EventDispatcherHandler.builder("", "")
-            .register_p2_im_message_receive_v1(self._handle_event)
+            .register_p2_im_message_receive_v1(self._events.put)
             .build()
         )
         self._ws_client = lark.ws.Client(
@@ -58,6 +176,7 @@ class FeishuAdapter(ChatAdapter):
     def stop(self) -> None:
         """Stop WebSocket connection."""
         self._running = False
+        self._events.put(None)  # Stop the event worker after queued events
         # Note: lark_oapi WebSocket client doesn't have a clean stop method
         log.info("[Feishu] Adapter stopped")
 
@@ -72,7 +191,7 @@ class FeishuAdapter(ChatAdapter):
         body = CreateMessageRequestBody.builder() \
             .receive_id(chat_id) \
             .msg_type("interactive") \
-            .content(json.dumps(card, ensure_ascii=False)) \
+            .content(_card_json(card)) \
             .build()
         req = CreateMessageRequest.builder() \
             .receive_id_type("chat_id") \
@@ -91,17 +210,66 @@ class FeishuAdapter(ChatAdapter):
         return None
 
     def update_card(self, handle: CardHandle, content: str, title: str = "") -> bool:
-        """Update an existing card message."""
+        """Update an existing card message.
+        
+        Updates are coalesced per card: if a PATCH for the same card is still
+        in flight, the new content is parked and the in-flight caller sends
+        only the latest parked version once its request returns. Intermediate
+        states are dropped (Feishu only shows the latest), the final one never
+        is. Parked callers wait for that PATCH and return its result.
+        """
         if not handle or not handle.message_id:
             log.warning("[Feishu] Cannot update card: no message_id")
             return False
         
+        message_id = handle.message_id
+        with self._card_lock:
+            if message_id in self._card_pending:
+                parked = self._card_pending[message_id]
+                if parked is None:
+                    parked = self._card_pending[message_id] = _ParkedUpdate(content, title)
+                else:
+                    # Supersede the parked content; its callers share our result
+                    parked.content, parked.title = content, title
+            else:
+                parked = None
+                self._card_pending[message_id] = None
+        
+        if parked is not None:
+            parked.done.wait()
+            return parked.ok
+        
+        current: _ParkedUpdate | None = None
+        try:
+            while True:
+                ok = self._patch_card(message_id, content, title)
+                if current is not None:
+                    current.ok = ok
+                    current.done.set()
+                with self._card_lock:
+                    current = self._card_pending[message_id]
+                    if current is None:
+                        del self._card_pending[message_id]
+                        return ok
+                    self._card_pending[message_id] = None
+                content, title = current.content, current.title
+        except BaseException:
+            # Release everyone waiting on this card; they see a failed update
+            with self._card_lock:
+                parked = self._card_pending.pop(message_id, None)
+            for waiter in (current, parked):
+                if waiter is not None:
+                    waiter.done.set()
+            raise
+
+    def _patch_card(self, message_id: str, content: str, title: str) -> bool:
+        """PATCH a card's content (one Feishu API call)."""
         card = self._build_card(content, title)
         body = PatchMessageRequestBody.builder() \
-            .content(json.dumps(card, ensure_ascii=False)) \
+            .content(_card_json(card)) \
             .build()
         req = PatchMessageRequest.builder() \
-            .message_id(handle.message_id) \
+            .message_id(message_id) \
             .request_body(body) \
             .build()
         resp = self._client.im.v1.message.patch(req)
@@ -110,33 +278,52 @@ class FeishuAdapter(ChatAdapter):
             log.error("[Feishu] Update card failed: code=%s msg=%s", resp.code, resp.msg)
             return False
         
-        log.info("[Feishu] Card updated: %s", handle.message_id)
+        log.info("[Feishu] Card updated: %s", message_id)
         return True
 
     def _build_card(self, markdown_text: str, title: str = "") -> dict:
         """Build a Feishu interactive card from markdown text."""
-        elements = []
-        parts = markdown_text.split("```")
-        for i, part in enumerate(parts):
-            if i % 2 == 0:
-                if part.strip():
-                    elements.append({"tag": "markdown", "content": part.strip()})
-            else:
-                lines = part.split("\n", 1)
-                lang = lines[0].strip() if lines else ""
-                code = lines[1] if len(lines) > 1 else part
-                elements.append({"tag": "markdown", "content": f"```{lang}\n{code.strip()}\n```"})
-        
-        if not elements:
-            elements.append({"tag": "markdown", "content": markdown_text})
+        if "```" not in markdown_text:
+            # No code fences (most short replies): a single markdown element
+            elements = [{"tag": "markdown", "content": markdown_text.strip() or markdown_text}]
+        else:
+            elements = self._fenced_elements(markdown_text)
         
         card = {"config": {"wide_screen_mode": True}, "elements": elements}
         if title:
             card["header"] = {"title": {"tag": "plain_text", "content": title}}
         return card
 
+    @staticmethod
+    def _fenced_elements(markdown_text: str) -> list[dict]:
+        """Split markdown into prose and fenced code block elements, in order."""
+        elements = []
+        pos = 0
+        for m in _FENCE_RE.finditer(markdown_text):
+            prose = markdown_text[pos:m.start()].strip()
+            if prose:
+                elements.append({"tag": "markdown", "content": prose})
+            first_line, code = m.group(1, 2)
+            if code is None:
+                # Fence with no newline: the whole span is both lang and code
+                code = first_line
+            elements.append({"tag": "markdown", "content": f"```{first_line.strip()}\n{code.strip()}\n```"})
+            pos = m.end()
+        prose = markdown_text[pos:].strip()
+        if prose:
+            elements.append({"tag": "markdown", "content": prose})
+        
+        if not elements:
+            elements.append({"tag": "markdown", "content": markdown_text})
+        return elements
+
     def _download_image(self, message_id: str, image_key: str) -> tuple[bytes, str] | None:
-        """Download image from Feishu. Returns (data, mime_type) or None."""
+        """Download image from Feishu. Returns (base64 data, mime_type) or None.
+        
+        The response body is encoded straight from the SDK's in-memory file
+        buffer (no read() copy) and released right after, so only the base64
+        copy outlives this call.
+        """
         try:
             req = GetMessageResourceRequest.builder() \
                 .message_id(message_id) \
@@ -148,33 +335,37 @@ class FeishuAdapter(ChatAdapter):
                 log.error("[Feishu] Download image failed: %s %s", resp.code, resp.msg)
                 return None
             
-            data = resp.file.read()
-            # Detect mime type from magic bytes
-            if data[:8] == b'\x89PNG\r\n\x1a\n':
-                mime = "image/png"
-            elif data[:2] == b'\xff\xd8':
-                mime = "image/jpeg"
-            elif data[:6] in (b'GIF87a', b'GIF89a'):
-                mime = "image/gif"
-            elif data[:4] == b'RIFF' and data[8:12] == b'WEBP':
-                mime = "image/webp"
-            else:
-                mime = "image/png"
-            
-            log.info("[Feishu] Downloaded image: %d bytes, %s", len(data), mime)
-            return (data, mime)
+            file = resp.file
+            view = file.getbuffer() if hasattr(file, "getbuffer") else memoryview(file.read())
+            try:
+                mime = _sniff_mime(bytes(view[:12]))
+                log.info("[Feishu] Downloaded image: %d bytes, %s", view.nbytes, mime)
+                b64 = binascii.b2a_base64(view, newline=False)
+            finally:
+                view.release()
+            return (b64, mime)
         except Exception as e:
             log.exception("[Feishu] Download image error: %s", e)
             return None
 
+    def _event_loop(self) -> None:
+        """Process received events in arrival order until stop()."""
+        while True:
+            data = self._events.get()
+            if data is None:
+                break
+            self._handle_event(data)
+
     def _handle_event(self, data: P2ImMessageReceiveV1):
         """Handle incoming Feishu message event."""
-        if not self._message_callback:
+        callback = self._message_callback
+        if not callback:
             return
 
         try:
-            msg = data.event.message
-            sender = data.event.sender
+            event = data.event
+            msg = event.message
+            sender = event.sender
 
             # Ignore bot messages
             if sender and sender.sender_type == "app":
@@ -182,20 +373,30 @@ class FeishuAdapter(ChatAdapter):
 
             chat_id = msg.chat_id
             feishu_chat_type = msg.chat_type  # "p2p" or "group"
-            chat_type = ChatType.PRIVATE if feishu_chat_type == "p2p" else ChatType.GROUP
+            chat_type = _CHAT_TYPES.get(feishu_chat_type, ChatType.GROUP)
             msg_type = msg.message_type
             message_id = msg.message_id
             user_id = sender.sender_id.user_id if sender and sender.sender_id else ""
 
-            # Check if bot is mentioned (for group chats)
+            # Check if bot is mentioned (for group chats); bot mention
+            # placeholders are removed, others become "@name"
             mentions_bot = False
+            bot_keys = []
             mention_map = {}
-            if msg.mentions:
-                for m in msg.mentions:
-                    if m.name == self._bot_name:
+            mentions = msg.mentions
+            if mentions:
+                bot_name = self._bot_name
+                for m in mentions:
+                    name = m.name
+                    is_bot = name == bot_name
+                    if is_bot:
                         mentions_bot = True
-                    if m.key:
-                        mention_map[m.key] = f"@{m.name}" if m.name else ""
+                    key = m.key
+                    if key:
+                        if is_bot:
+                            bot_keys.append(key)
+                        else:
+                            mention_map[key] = "@" + name if name else ""
 
             # Group chat: only process if bot is mentioned
             if chat_type == ChatType.GROUP and not mentions_bot:
@@ -205,50 +406,26 @@ class FeishuAdapter(ChatAdapter):
             images = []
 
             if msg_type == "text":
-                content = json.loads(msg.content)
-                text = content.get("text", "").strip()
-                # Replace mention placeholders
-                for key, name in mention_map.items():
-                    if name == f"@{self._bot_name}":
-                        text = text.replace(key, "").strip()
-                    else:
-                        text = text.replace(key, name)
+                content = orjson.loads(msg.content)
+                text = _apply_mentions(content.get("text", ""), bot_keys, mention_map)
 
             elif msg_type == "image":
-                content = json.loads(msg.content)
+                content = orjson.loads(msg.content)
                 image_key = content.get("image_key", "")
                 if image_key:
                     img_data = self._download_image(message_id, image_key)
                     if img_data:
-                        data, mime = img_data
-                        b64 = base64.b64encode(data).decode("ascii")
-                        images.append((b64, mime))
+                        images.append(img_data)
 
             elif msg_type == "post":
-                content = json.loads(msg.content)
+                content = orjson.loads(msg.content)
                 parts = []
-                for lang_content in content.values():
-                    if isinstance(lang_content, dict):
-                        for item in lang_content.get("content", []):
-                            if isinstance(item, list):
-                                for elem in item:
-                                    if isinstance(elem, dict):
-                                        if elem.get("tag") == "text":
-                                            parts.append(elem.get("text", ""))
-                                        elif elem.get("tag") == "img":
-                                            image_key = elem.get("image_key", "")
-                                            if image_key:
-                                                img_data = self._download_image(message_id, image_key)
-                                                if img_data:
-                                                    data, mime = img_data
-                                                    b64 = base64.b64encode(data).decode("ascii")
-                                                    images.append((b64, mime))
-                text = " ".join(parts).strip()
-                for key, name in mention_map.items():
-                    if name == f"@{self._bot_name}":
-                        text = text.replace(key, "").strip()
-                    else:
-                        text = text.replace(key, name)
+                get_handler = _POST_HANDLERS.get
+                for elem in _post_elements(content):
+                    handler = get_handler(elem.get("tag"))
+                    if handler is not None:
+                        handler(self, message_id, elem, parts, images)
+                text = _apply_mentions(" ".join(parts), bot_keys, mention_map)
             else:
                 log.debug("[Feishu] Ignoring message type: %s", msg_type)
                 return
@@ -267,12 +444,12 @@ class FeishuAdapter(ChatAdapter):
                 text=text,
                 images=images if images else None,
                 raw={
-                    "_platform": "feishu",
+                    "_platform": _PLATFORM,
                     "message_id": message_id,
                     "mentions_bot": mentions_bot,
                 },
             )
-            self._message_callback(incoming)
+            callback(incoming)
 
         except Exception as e:
             log.exception("[Feishu] Handle event error: %s", e)
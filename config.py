@@ -1,26 +1,139 @@
 """Configuration management for kirocli-bot-gateway."""
 
-import json
+import functools
 import logging
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
-from dotenv import load_dotenv
+import orjson
 
 log = logging.getLogger(__name__)
 
+# Characters not allowed in a per-chat directory name (\w is exactly
+# str.isalnum() plus "_", so Unicode letters and digits are kept)
+_UNSAFE_PATH_CHARS_RE = re.compile(r"[^\w-]")
+# The same rule for ASCII input as a translate table
+_ASCII_SANITIZE_TABLE = str.maketrans({
+    c: "_" for c in map(chr, range(128)) if not (c.isalnum() or c in "-_")
+})
+
+# Accepted env values for boolean flags, and valid workspace modes
+_TRUTHY = frozenset(("true", "1", "yes"))
+# The same values in the casings people actually write (no lower() needed)
+_TRUTHY_RAW = _TRUTHY | frozenset(("True", "TRUE", "Yes", "YES"))
+_WORKSPACE_MODE_MAP = {mode: mode for mode in ("fixed", "per_chat")}
+
+# Working directory at startup: the fallback for every cwd setting (the
+# gateway never changes directory, so one getcwd() is enough)
+_PROCESS_CWD = os.getcwd()
+
+# Trailing " # comment" on an unquoted .env value
+_INLINE_COMMENT_RE = re.compile(r"\s+#.*")
+
+# .env beside this module (the project root, see README)
+_DOTENV_PATH = Path(__file__).resolve().parent / ".env"
+
+# Keys os.environ currently holds because .env set them (see _apply_env_file)
+_dotenv_keys: set[str] = set()
+
+# Chat IDs whose sanitized name / session directory are kept cached
+_SESSION_CWD_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_SESSION_CWD_CACHE_SIZE)
+def _sanitize_chat_id(chat_id: str) -> str:
+    """Make a chat_id safe for use as a directory name."""
+    if chat_id.isascii():
+        # Platform chat IDs are ASCII in practice: one C-level table pass
+        return chat_id.translate(_ASCII_SANITIZE_TABLE)
+    return _UNSAFE_PATH_CHARS_RE.sub("_", chat_id)
+
+
+def _load_env_file(path: Path) -> dict[str, str]:
+    """Parse KEY=VALUE lines from a .env file (the first of duplicate keys wins).
+    
+    Supports what .env.example uses: blank lines, # comments (full-line, or
+    after whitespace in unquoted values), an optional "export " prefix and
+    single/double-quoted values.
+    """
+    values: dict[str, str] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("export "):
+                line = line[7:]
+            key, sep, value = line.partition("=")
+            key = key.strip()
+            if not sep or not key or key in values:
+                continue
+            quoted = value.strip()
+            if quoted[:1] in ("'", '"'):
+                end = quoted.find(quoted[0], 1)
+                value = quoted[1:end] if end > 0 else quoted[1:]
+            else:
+                # Before stripping, so "KEY=   # note" is an empty value
+                value = _INLINE_COMMENT_RE.sub("", value).strip()
+            values[key] = value
+    return values
+
+
+def _apply_env_file(path: Path) -> None:
+    """Put the .env values into os.environ.
+    
+    Variables set in the real environment take precedence. Keys a previous
+    load took from .env are overwritten, and dropped if .env no longer has
+    them, so reload_config() sees edits to the file.
+    """
+    global _dotenv_keys
+    values = _load_env_file(path) if path.is_file() else {}
+    for key in _dotenv_keys - values.keys():
+        os.environ.pop(key, None)
+    applied = set()
+    for key, value in values.items():
+        if key in os.environ and key not in _dotenv_keys:
+            continue
+        os.environ[key] = value
+        applied.add(key)
+    _dotenv_keys = applied
+
+
+def _env_flag(env: dict[str, str], name: str, default: str) -> bool:
+    """Parse a boolean env var ("true"/"1"/"yes", any case)."""
+    value = env.get(name, default)
+    return value in _TRUTHY_RAW or value.lower() in _TRUTHY
+
 
 def _parse_workspace_mode(value: str | None, default: str = "per_chat") -> str:
     """Parse and validate workspace_mode value."""
     if not value:
         return default
-    value = value.lower().strip()
-    return value if value in ("fixed", "per_chat") else default
+    mode = _WORKSPACE_MODE_MAP.get(value)  # Already canonical (the usual case)
+    if mode is None:
+        mode = _WORKSPACE_MODE_MAP.get(value.lower().strip(), default)
+    return mode
 
 
-@dataclass
+def _parse_worker_threads(value: str | None, default: int = 32) -> int:
+    """Parse KIRO_WORKER_THREADS; unset means default, invalid logs and uses it."""
+    if not value:
+        return default
+    try:
+        threads = int(value)
+    except ValueError:
+        threads = 0
+    if threads < 1:
+        log.error("Invalid KIRO_WORKER_THREADS=%r (expected a positive integer), using %d",
+                  value, default)
+        return default
+    return threads
+
+
+@dataclass(slots=True, frozen=True)
 class FeishuConfig:
     """Feishu adapter configuration."""
     enabled: bool = False
@@ -40,14 +153,14 @@ class DiscordChannelPolicy:
     """Policy for a specific Discord channel."""
     allow: bool = False
     require_mention: bool | None = None  # None = inherit from guild
-    users: list[str] = field(default_factory=list)  # Per-channel user allowlist
+    users: frozenset[str] = frozenset()  # Per-channel user allowlist
 
 
 @dataclass
 class DiscordGuildPolicy:
     """Policy for a specific Discord guild (server)."""
     require_mention: bool = True
-    users: list[str] = field(default_factory=list)  # Per-guild user allowlist
+    users: frozenset[str] = frozenset()  # Per-guild user allowlist
     channels: dict[str, DiscordChannelPolicy] = field(default_factory=dict)
 
 
@@ -56,7 +169,7 @@ class DiscordDmPolicy:
     """Policy for Discord DMs."""
     enabled: bool = True
     policy: str = "allowlist"  # "open" | "allowlist" | "disabled"
-    allow_from: list[str] = field(default_factory=list)  # User IDs allowed to DM
+    allow_from: frozenset[str] = frozenset()  # User IDs allowed to DM
 
 
 @dataclass
@@ -73,6 +186,24 @@ class DiscordPolicy:
     guilds: dict[str, DiscordGuildPolicy] = field(default_factory=dict)
     allow_bots: bool = False  # Whether to respond to other bots
     
+    def __post_init__(self):
+        # Flattened (guild key, channel key) views of guilds[*].channels, with
+        # require_mention inheritance already resolved
+        self._channel_rules: dict[tuple[str, str], DiscordChannelPolicy] = {}
+        self._mention_rules: dict[tuple[str, str], bool] = {}
+        for guild_key, guild_policy in self.guilds.items():
+            for channel_key, channel_policy in guild_policy.channels.items():
+                self._channel_rules[(guild_key, channel_key)] = channel_policy
+                self._mention_rules[(guild_key, channel_key)] = (
+                    guild_policy.require_mention if channel_policy.require_mention is None
+                    else channel_policy.require_mention
+                )
+        
+        # Per-message lookups are memoized per instance; a policy is never
+        # mutated after load (reloading builds a new DiscordPolicy)
+        self._check_guild_access_cached = functools.lru_cache(maxsize=4096)(self._check_guild_access_impl)
+        self._require_mention_cached = functools.lru_cache(maxsize=1024)(self._get_require_mention_impl)
+    
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "DiscordPolicy":
         """Parse policy from dict (loaded from JSON)."""
@@ -81,7 +212,7 @@ class DiscordPolicy:
         dm = DiscordDmPolicy(
             enabled=dm_data.get("enabled", True),
             policy=dm_data.get("policy", "allowlist"),
-            allow_from=dm_data.get("allowFrom", []),
+            allow_from=frozenset(dm_data.get("allowFrom", ())),
         )
         
         # Parse guilds
@@ -94,7 +225,7 @@ class DiscordPolicy:
                     channels[channel_id] = DiscordChannelPolicy(
                         allow=channel_data.get("allow", False),
                         require_mention=channel_data.get("requireMention"),
-                        users=channel_data.get("users", []),
+                        users=frozenset(channel_data.get("users", ())),
                     )
                 elif isinstance(channel_data, bool):
                     # Shorthand: "channel_id": true
@@ -102,7 +233,7 @@ class DiscordPolicy:
             
             guilds[guild_id] = DiscordGuildPolicy(
                 require_mention=guild_data.get("requireMention", True),
-                users=guild_data.get("users", []),
+                users=frozenset(guild_data.get("users", ())),
                 channels=channels,
             )
         
@@ -143,6 +274,9 @@ class DiscordPolicy:
         
         Returns: (allowed, reason)
         """
+        return self._check_guild_access_cached(guild_id, channel_id, user_id)
+    
+    def _check_guild_access_impl(self, guild_id: str, channel_id: str, user_id: str) -> tuple[bool, str]:
         if self.group_policy == "disabled":
             return False, "Guild access disabled"
         
@@ -151,7 +285,8 @@ class DiscordPolicy:
         
         # group_policy == "allowlist"
         # Check for specific guild config, then "*" wildcard
-        guild_policy = self.guilds.get(guild_id) or self.guilds.get("*")
+        guild_key = guild_id if guild_id in self.guilds else "*"
+        guild_policy = self.guilds.get(guild_key)
         
         if not guild_policy:
             return False, f"Guild {guild_id} not in allowlist"
@@ -162,7 +297,8 @@ class DiscordPolicy:
         
         # Check channel allowlist (if channels are specified)
         if guild_policy.channels:
-            channel_policy = guild_policy.channels.get(channel_id) or guild_policy.channels.get("*")
+            channel_policy = (self._channel_rules.get((guild_key, channel_id))
+                              or self._channel_rules.get((guild_key, "*")))
             
             if not channel_policy:
                 return False, f"Channel {channel_id} not in guild's channel allowlist"
@@ -178,21 +314,23 @@ class DiscordPolicy:
     
     def get_require_mention(self, guild_id: str, channel_id: str) -> bool:
         """Get whether mention is required for a guild/channel."""
-        guild_policy = self.guilds.get(guild_id) or self.guilds.get("*")
+        return self._require_mention_cached(guild_id, channel_id)
+    
+    def _get_require_mention_impl(self, guild_id: str, channel_id: str) -> bool:
+        guild_key = guild_id if guild_id in self.guilds else "*"
+        guild_policy = self.guilds.get(guild_key)
         
         if not guild_policy:
             return True  # Default: require mention
         
-        # Check channel-specific setting
-        if guild_policy.channels:
-            channel_policy = guild_policy.channels.get(channel_id) or guild_policy.channels.get("*")
-            if channel_policy and channel_policy.require_mention is not None:
-                return channel_policy.require_mention
-        
-        return guild_policy.require_mention
+        # Channel-specific setting (inheritance from the guild is pre-resolved)
+        require_mention = self._mention_rules.get((guild_key, channel_id))
+        if require_mention is None:
+            require_mention = self._mention_rules.get((guild_key, "*"), guild_policy.require_mention)
+        return require_mention
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiscordConfig:
     """Discord adapter configuration."""
     enabled: bool = False
@@ -202,30 +340,64 @@ class DiscordConfig:
     policy: DiscordPolicy = field(default_factory=DiscordPolicy)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KiroConfig:
     """Kiro CLI configuration."""
     path: str = "kiro"
     default_cwd: str = ""  # Default working directory if platform doesn't specify
     idle_timeout: int = 300  # seconds
     workspace_mode: str = "per_chat"  # Global default: "fixed" or "per_chat"
+    worker_threads: int = 32  # Gateway threads processing chat messages
 
 
-@dataclass
+class _PlatformDirs(NamedTuple):
+    """A platform's resolved workspace settings (see Config._resolve_platform)."""
+    mode: str  # "fixed" | "per_chat"
+    fixed_cwd: str | None  # Shared directory in fixed mode, None in per_chat
+    per_chat_prefix: str | None  # Base dir + separator in per_chat, None in fixed
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
     """Main configuration."""
     feishu: FeishuConfig = field(default_factory=FeishuConfig)
     discord: DiscordConfig = field(default_factory=DiscordConfig)
     kiro: KiroConfig = field(default_factory=KiroConfig)
     log_level: str = "INFO"
+    
+    # Resolved per-platform rules (see _resolve_platform) and session
+    # directories; the config is not modified after load_config()
+    _resolved: dict[str, _PlatformDirs] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _session_cwd_cache: dict[tuple[str, str], str] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for platform in ("feishu", "discord"):
+            self._resolved[platform] = self._resolve_platform(platform)
+
+    def _resolve_platform(self, platform: str) -> "_PlatformDirs":
+        """Resolve a platform's workspace fallbacks once (see _PlatformDirs)."""
+        platform_config = {"feishu": self.feishu, "discord": self.discord}.get(platform)
+        mode = (platform_config and platform_config.workspace_mode) or self.kiro.workspace_mode
+        base = (platform_config and platform_config.kiro_cwd) or self.kiro.default_cwd or _PROCESS_CWD
+        # Absolute and normalized once (no "..", no trailing separator)
+        base = os.path.abspath(base)
+        if mode == "per_chat":
+            # The sanitized chat ID has no separators, so prefix + ID is
+            # equivalent to os.path.join(base, ID)
+            return _PlatformDirs(mode, None, base.rstrip(os.sep) + os.sep)
+        return _PlatformDirs(mode, base, None)
+
+    def _platform(self, platform: str) -> "_PlatformDirs":
+        resolved = self._resolved.get(platform)
+        if resolved is None:
+            resolved = self._resolved[platform] = self._resolve_platform(platform)
+        return resolved
 
     def get_workspace_mode(self, platform: str) -> str:
         """Get workspace_mode for a platform (platform-specific or global default)."""
-        if platform == "feishu" and self.feishu.workspace_mode:
-            return self.feishu.workspace_mode
-        elif platform == "discord" and self.discord.workspace_mode:
-            return self.discord.workspace_mode
-        return self.kiro.workspace_mode
+        return self._platform(platform).mode
 
     def get_kiro_cwd(self, platform: str) -> str | None:
         """Get base working directory for kiro-cli startup.
@@ -233,17 +405,7 @@ class Config:
         Returns None in per_chat mode (use global ~/.kiro/ config).
         Returns platform cwd in fixed mode (use project-level .kiro/ config).
         """
-        mode = self.get_workspace_mode(platform)
-        if mode == "per_chat":
-            # Don't pass cwd, let kiro-cli use global config
-            return None
-        
-        # fixed mode: use platform-specific or default cwd
-        if platform == "feishu" and self.feishu.kiro_cwd:
-            return self.feishu.kiro_cwd
-        elif platform == "discord" and self.discord.kiro_cwd:
-            return self.discord.kiro_cwd
-        return self.kiro.default_cwd or os.getcwd()
+        return self._platform(platform).fixed_cwd
 
     def get_session_cwd(self, platform: str, chat_id: str) -> str:
         """Get working directory for a specific chat session.
@@ -251,30 +413,21 @@ class Config:
         In 'fixed' mode: all chats share the platform's base directory.
         In 'per_chat' mode: each chat gets its own subdirectory under default_cwd.
         """
-        mode = self.get_workspace_mode(platform)
-        
-        if mode == "per_chat":
-            # Use default_cwd as base for per_chat subdirectories
-            if platform == "feishu" and self.feishu.kiro_cwd:
-                base = self.feishu.kiro_cwd
-            elif platform == "discord" and self.discord.kiro_cwd:
-                base = self.discord.kiro_cwd
-            else:
-                base = self.kiro.default_cwd or os.getcwd()
-            
-            # Sanitize chat_id for use in path
-            safe_chat_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in chat_id)
-            return os.path.join(base, safe_chat_id)
+        dirs = self._platform(platform)
+        prefix = dirs.per_chat_prefix
+        if prefix is None:
+            return dirs.fixed_cwd
         
-        # fixed mode: all sessions share the same directory
-        if platform == "feishu" and self.feishu.kiro_cwd:
-            return self.feishu.kiro_cwd
-        elif platform == "discord" and self.discord.kiro_cwd:
-            return self.discord.kiro_cwd
-        return self.kiro.default_cwd or os.getcwd()
+        key = (platform, chat_id)
+        cwd = self._session_cwd_cache.get(key)
+        if cwd is None:
+            if len(self._session_cwd_cache) >= _SESSION_CWD_CACHE_SIZE:
+                self._session_cwd_cache.clear()
+            cwd = self._session_cwd_cache[key] = prefix + _sanitize_chat_id(chat_id)
+        return cwd
 
 
-def _load_discord_policy(config_dir: str) -> DiscordPolicy:
+def _load_discord_policy(config_dir: str, env: dict[str, str]) -> DiscordPolicy:
     """Load Discord access policy.
     
     Priority:
@@ -287,8 +440,7 @@ def _load_discord_policy(config_dir: str) -> DiscordPolicy:
     # Priority 1: JSON file
     if policy_file.exists():
         try:
-            with open(policy_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(policy_file.read_bytes())
             policy = DiscordPolicy.from_dict(data)
             log.info("Loaded Discord policy from %s", policy_file)
             return policy
@@ -297,9 +449,10 @@ def _load_discord_policy(config_dir: str) -> DiscordPolicy:
             return DiscordPolicy()
     
     # Priority 2: Build from env vars
-    admin_user_ids = [x.strip() for x in os.getenv("DISCORD_ADMIN_USER_ID", "").split(",") if x.strip()]
-    guild_ids = [x.strip() for x in os.getenv("DISCORD_GUILD_ID", "").split(",") if x.strip()]
-    require_mention = os.getenv("DISCORD_REQUIRE_MENTION", "true").lower() in ("true", "1", "yes")
+    admin_user_ids = [x.strip() for x in env.get("DISCORD_ADMIN_USER_ID", "").split(",") if x.strip()]
+    admin_set = frozenset(admin_user_ids)
+    guild_ids = [x.strip() for x in env.get("DISCORD_GUILD_ID", "").split(",") if x.strip()]
+    require_mention = _env_flag(env, "DISCORD_REQUIRE_MENTION", "true")
     
     if admin_user_ids:
         log.info("No discord_policy.json, building policy from env "
@@ -309,7 +462,7 @@ def _load_discord_policy(config_dir: str) -> DiscordPolicy:
         dm = DiscordDmPolicy(
             enabled=True,
             policy="allowlist",
-            allow_from=admin_user_ids,
+            allow_from=admin_set,
         )
         
         guilds: dict[str, DiscordGuildPolicy] = {}
@@ -318,14 +471,14 @@ def _load_discord_policy(config_dir: str) -> DiscordPolicy:
             for gid in guild_ids:
                 guilds[gid] = DiscordGuildPolicy(
                     require_mention=require_mention,
-                    users=admin_user_ids,
+                    users=admin_set,
                     channels={"*": DiscordChannelPolicy(allow=True)},
                 )
         else:
             # No specific guild: admin users in any guild
             guilds["*"] = DiscordGuildPolicy(
                 require_mention=require_mention,
-                users=admin_user_ids,
+                users=admin_set,
             )
         
         return DiscordPolicy(
@@ -349,43 +502,75 @@ def _load_discord_policy(config_dir: str) -> DiscordPolicy:
     )
 
 
+def _load_feishu_config(env: dict[str, str]) -> FeishuConfig:
+    """Feishu settings; the rest of the FEISHU_* vars are skipped if disabled."""
+    if not _env_flag(env, "FEISHU_ENABLED", "true"):
+        return FeishuConfig(enabled=False)
+    return FeishuConfig(
+        enabled=True,
+        app_id=env.get("FEISHU_APP_ID", ""),
+        app_secret=env.get("FEISHU_APP_SECRET", ""),
+        bot_name=env.get("FEISHU_BOT_NAME", ""),
+        kiro_cwd=env.get("FEISHU_KIRO_CWD", ""),
+        workspace_mode=_parse_workspace_mode(env.get("FEISHU_WORKSPACE_MODE"), ""),
+    )
+
+
+def _load_discord_config(config_dir: str, env: dict[str, str]) -> DiscordConfig:
+    """Discord settings; the policy and DISCORD_* vars are skipped if disabled."""
+    if not _env_flag(env, "DISCORD_ENABLED", "false"):
+        return DiscordConfig(enabled=False)
+    return DiscordConfig(
+        enabled=True,
+        bot_token=env.get("DISCORD_BOT_TOKEN", ""),
+        kiro_cwd=env.get("DISCORD_KIRO_CWD", ""),
+        workspace_mode=_parse_workspace_mode(env.get("DISCORD_WORKSPACE_MODE"), ""),
+        # Load Discord policy from JSON file
+        policy=_load_discord_policy(config_dir, env),
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load configuration from environment variables."""
-    load_dotenv()
+    """Load configuration from environment variables.
     
-    # Determine config directory (where .env is located)
-    config_dir = os.getcwd()
-
-    feishu = FeishuConfig(
-        enabled=os.getenv("FEISHU_ENABLED", "true").lower() in ("true", "1", "yes"),
-        app_id=os.getenv("FEISHU_APP_ID", ""),
-        app_secret=os.getenv("FEISHU_APP_SECRET", ""),
-        bot_name=os.getenv("FEISHU_BOT_NAME", ""),
-        kiro_cwd=os.getenv("FEISHU_KIRO_CWD", ""),
-        workspace_mode=_parse_workspace_mode(os.getenv("FEISHU_WORKSPACE_MODE"), ""),
-    )
+    The result is cached: later calls return the same Config without
+    re-reading .env or discord_policy.json. Use reload_config() to pick up
+    changes. Adapters and the Gateway keep the Config they were built with.
+    """
+    return _load_config_impl()
 
-    # Load Discord policy from JSON file
-    discord_policy = _load_discord_policy(config_dir)
+
+def reload_config() -> Config:
+    """Drop the cached configuration and load it again (re-reading .env)."""
+    load_config.cache_clear()
+    return load_config()
+
+
+def _load_config_impl() -> Config:
+    # Deployments that inject env vars directly have no .env
+    _apply_env_file(_DOTENV_PATH)
     
-    discord = DiscordConfig(
-        enabled=os.getenv("DISCORD_ENABLED", "false").lower() in ("true", "1", "yes"),
-        bot_token=os.getenv("DISCORD_BOT_TOKEN", ""),
-        kiro_cwd=os.getenv("DISCORD_KIRO_CWD", ""),
-        workspace_mode=_parse_workspace_mode(os.getenv("DISCORD_WORKSPACE_MODE"), ""),
-        policy=discord_policy,
-    )
+    # One snapshot of the environment for all the lookups below
+    env = dict(os.environ)
+    
+    # Determine config directory (where .env is located)
+    config_dir = _PROCESS_CWD
+
+    feishu = _load_feishu_config(env)
+    discord = _load_discord_config(config_dir, env)
 
     kiro = KiroConfig(
-        path=os.getenv("KIRO_PATH", "kiro-cli"),
-        default_cwd=os.getenv("KIRO_CWD", os.getcwd()),
-        idle_timeout=int(os.getenv("KIRO_IDLE_TIMEOUT", "300")),
-        workspace_mode=_parse_workspace_mode(os.getenv("KIRO_WORKSPACE_MODE"), "per_chat"),
+        path=env.get("KIRO_PATH", "kiro-cli"),
+        default_cwd=env.get("KIRO_CWD", _PROCESS_CWD),
+        idle_timeout=int(env.get("KIRO_IDLE_TIMEOUT", "300")),
+        workspace_mode=_parse_workspace_mode(env.get("KIRO_WORKSPACE_MODE"), "per_chat"),
+        worker_threads=_parse_worker_threads(env.get("KIRO_WORKER_THREADS")),
     )
 
     return Config(
         feishu=feishu,
         discord=discord,
         kiro=kiro,
-        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        log_level=env.get("LOG_LEVEL", "INFO"),
     )
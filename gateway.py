@@ -7,13 +7,16 @@ workspace_mode only affects session working directories, not Kiro CLI instances.
 
 import logging
 import os
+import random
 import signal
 import sys
 import threading
 import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
-from adapters.base import ChatAdapter, IncomingMessage, CardHandle
+from adapters.base import AdapterError, ChatAdapter, IncomingMessage, CardHandle
 from acp_client import ACPClient, PromptResult, PermissionRequest
 from config import Config
 
@@ -22,35 +25,43 @@ log = logging.getLogger(__name__)
 # Permission request timeout (seconds)
 _PERMISSION_TIMEOUT = 60
 
+# Upper bound for the jittered delay between prompt retries (seconds)
+_RETRY_BACKOFF_MAX = 8.0
+
+# Replies to a permission request, and words that cancel the current prompt
+_PERM_ALLOW_ONCE = frozenset(("y", "yes", "ok"))
+_PERM_DENY = frozenset(("n", "no"))
+_PERM_ALLOW_ALWAYS = frozenset(("t", "trust", "always"))
+_CANCEL_WORDS = frozenset(("cancel", "stop"))
+# Longer messages can't be one of the words above, so they skip lower()
+_KEYWORD_MAX_LEN = 16
+
+# Tool call kind / status -> icon in format_response
+_TOOL_ICONS = {"fs": "📄", "edit": "📝", "terminal": "⚡", "other": "🔧"}
+_STATUS_ICONS = {"completed": "✅", "failed": "❌"}
+
 
 def format_response(result: PromptResult) -> str:
     """Format Kiro's response with tool call info."""
-    parts = []
+    refused = result.stop_reason == "refusal"
+    if refused:
+        body = f"{result.text or '🚫 Operation cancelled'}\n\n💬 You can continue the conversation"
+    else:
+        body = result.text
 
-    # Show tool calls
+    if not result.tool_calls:
+        return body or "(No response)"
+
+    # Show tool calls, separated from the text by a blank line
+    lines = []
     for tc in result.tool_calls:
-        icon = {"fs": "📄", "edit": "📝", "terminal": "⚡", "other": "🔧"}.get(tc.kind, "🔧")
-        if result.stop_reason == "refusal" and tc.status != "completed":
+        if refused and tc.status != "completed":
             status_icon = "🚫"
         else:
-            status_icon = {"completed": "✅", "failed": "❌"}.get(tc.status, "⏳")
-        line = f"{icon} {tc.title} {status_icon}"
-        parts.append(line)
-
-    if parts:
-        parts.append("")
-
-    if result.stop_reason == "refusal":
-        if result.text:
-            parts.append(result.text)
-        else:
-            parts.append("🚫 Operation cancelled")
-        parts.append("")
-        parts.append("💬 You can continue the conversation")
-    elif result.text:
-        parts.append(result.text)
-
-    return "\n".join(parts) if parts else "(No response)"
+            status_icon = _STATUS_ICONS.get(tc.status, "⏳")
+        lines.append(f"{_TOOL_ICONS.get(tc.kind, '🔧')} {tc.title} {status_icon}")
+    tools = "\n".join(lines)
+    return f"{tools}\n\n{body}" if body else f"{tools}\n"
 
 
 @dataclass
@@ -80,31 +91,46 @@ class Gateway:
         self._adapter_map: dict[str, ChatAdapter] = {a.platform_name: a for a in adapters}
         
         # Per-platform ACP clients: platform -> ACPClient
+        # Copy-on-write: writers hold _acp_lock and publish a new dict,
+        # readers use whatever dict is current without locking
         self._acp_clients: dict[str, ACPClient] = {}
         self._acp_lock = threading.Lock()
+        # platform -> lock held while that platform's kiro-cli starts
+        self._acp_start_locks: dict[str, threading.Lock] = {
+            p: threading.Lock() for p in self._adapter_map}
         
         # Per-platform last activity time: platform -> timestamp
+        # Timestamp refreshes are plain dict stores (atomic under the GIL)
         self._last_activity: dict[str, float] = {}
         
         # Chat context: "platform:chat_id" -> ChatContext
         self._contexts: dict[str, ChatContext] = {}
         self._contexts_lock = threading.Lock()
+        # platform -> keys in _contexts, so teardown doesn't scan every chat
+        self._platform_keys: defaultdict[str, set[str]] = defaultdict(set)
         
         # Processing state: "platform:chat_id" -> True if processing
         self._processing: dict[str, bool] = {}
         self._processing_lock = threading.Lock()
         
-        # Message queue: "platform:chat_id" -> list of (text, images)
-        self._message_queue: dict[str, list] = {}
+        # Message queue: "platform:chat_id" -> deque of (text, images)
+        self._message_queue: dict[str, deque] = {}
         self._queue_lock = threading.Lock()
         
         # Pending permission requests: "platform:chat_id" -> (event, result_holder)
         self._pending_permissions: dict[str, tuple[threading.Event, list]] = {}
         self._pending_permissions_lock = threading.Lock()
         
-        # session_id -> "platform:chat_id" mapping
+        # session_id -> "platform:chat_id" mapping (guarded by _contexts_lock)
         self._session_to_key: dict[str, str] = {}
         
+        # Session directories already created (set.add is atomic under the GIL)
+        self._created_dirs: set[str] = set()
+        
+        # Workers for chat messages (each blocks on a Kiro prompt)
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.kiro.worker_threads, thread_name_prefix="gw")
+        
         # Idle checker
         self._idle_checker_stop = threading.Event()
         self._idle_checker_thread: threading.Thread | None = None
@@ -127,6 +153,7 @@ class Gateway:
         def shutdown(sig, frame):
             log.info("[Gateway] Shutting down...")
             self._idle_checker_stop.set()
+            self._executor.shutdown(wait=False)
             self._stop_all_acp()
             for adapter in self._adapters:
                 adapter.stop()
@@ -163,9 +190,20 @@ class Gateway:
 
     def _start_acp(self, platform: str) -> ACPClient:
         """Start ACP client for a specific platform if not running."""
-        with self._acp_lock:
-            if platform in self._acp_clients and self._acp_clients[platform].is_running():
-                return self._acp_clients[platform]
+        acp = self._acp_clients.get(platform)
+        if acp is not None and acp.is_running():
+            return acp
+        
+        # Serialize starts per platform; spawning kiro-cli can take a while
+        # and must not hold _acp_lock, which every other platform needs
+        start_lock = self._acp_start_locks.get(platform)
+        if start_lock is None:
+            start_lock = self._acp_start_locks.setdefault(platform, threading.Lock())
+        
+        with start_lock:
+            acp = self._acp_clients.get(platform)
+            if acp is not None and acp.is_running():
+                return acp
             
             log.info("[Gateway] [%s] Starting kiro-cli...", platform)
             acp = ACPClient(cli_path=self._config.kiro.path)
@@ -178,16 +216,12 @@ class Gateway:
             # Use default argument to capture platform value (avoid closure issue)
             acp.on_permission_request(lambda req, p=platform: self._handle_permission(req, p))
             
-            self._acp_clients[platform] = acp
-            self._last_activity[platform] = time.time()
-            
-            # Clear sessions for this platform
-            with self._contexts_lock:
-                keys_to_remove = [k for k in self._contexts if k.startswith(f"{platform}:")]
-                for k in keys_to_remove:
-                    ctx = self._contexts.pop(k, None)
-                    if ctx and ctx.session_id:
-                        self._session_to_key.pop(ctx.session_id, None)
+            # Clear old sessions before publishing: once the new client is
+            # visible, other workers may create sessions on it
+            with self._acp_lock:
+                self._clear_sessions(platform)
+                self._last_activity[platform] = time.time()
+                self._acp_clients = {**self._acp_clients, platform: acp}
             
             mode = self._config.get_workspace_mode(platform)
             log.info("[Gateway] [%s] kiro-cli started (mode=%s, cwd=%s)", platform, mode, cwd)
@@ -196,43 +230,48 @@ class Gateway:
     def _stop_acp(self, platform: str):
         """Stop ACP client for a specific platform."""
         with self._acp_lock:
-            acp = self._acp_clients.pop(platform, None)
-            self._last_activity.pop(platform, None)
+            acp = self._remove_acp(platform)
             
         if acp is not None:
             log.info("[Gateway] [%s] Stopping kiro-cli...", platform)
             acp.stop()
             
-            # Clear sessions for this platform
-            with self._contexts_lock:
-                keys_to_remove = [k for k in self._contexts if k.startswith(f"{platform}:")]
-                for k in keys_to_remove:
-                    ctx = self._contexts.pop(k, None)
-                    if ctx and ctx.session_id:
-                        self._session_to_key.pop(ctx.session_id, None)
+            self._clear_sessions(platform)
             
             log.info("[Gateway] [%s] kiro-cli stopped", platform)
 
+    def _clear_sessions(self, platform: str):
+        """Drop all chat contexts of a platform after its kiro-cli starts or stops."""
+        with self._contexts_lock:
+            for k in self._platform_keys.pop(platform, ()):
+                ctx = self._contexts.pop(k, None)
+                if ctx and ctx.session_id:
+                    self._session_to_key.pop(ctx.session_id, None)
+
     def _stop_all_acp(self):
         """Stop all ACP clients."""
-        with self._acp_lock:
-            platforms = list(self._acp_clients.keys())
-        for platform in platforms:
+        for platform in list(self._acp_clients):
             self._stop_acp(platform)
 
+    def _remove_acp(self, platform: str) -> ACPClient | None:
+        """Unpublish a platform's ACP client. Caller holds _acp_lock."""
+        clients = dict(self._acp_clients)
+        acp = clients.pop(platform, None)
+        self._acp_clients = clients
+        self._last_activity.pop(platform, None)
+        return acp
+
     def _ensure_acp(self, platform: str) -> ACPClient:
         """Ensure ACP client is running for a platform."""
         acp = self._start_acp(platform)
-        with self._acp_lock:
-            self._last_activity[platform] = time.time()
+        self._last_activity[platform] = time.time()
         return acp
 
     def _get_acp(self, platform: str) -> ACPClient | None:
         """Get ACP client for a platform if running."""
-        with self._acp_lock:
-            acp = self._acp_clients.get(platform)
-            if acp and acp.is_running():
-                return acp
+        acp = self._acp_clients.get(platform)
+        if acp and acp.is_running():
+            return acp
         return None
 
     def _idle_checker_loop(self):
@@ -242,19 +281,26 @@ class Gateway:
             log.info("[Gateway] Idle timeout disabled")
             return
         
-        while not self._idle_checker_stop.wait(timeout=30):
+        # Sleep until the earliest platform could go idle. Activity only
+        # moves deadlines later, so waking up early just means re-checking.
+        wait = idle_timeout
+        while not self._idle_checker_stop.wait(timeout=wait):
             platforms_to_stop = []
+            wait = idle_timeout
             
-            with self._acp_lock:
-                now = time.time()
-                for platform, last in self._last_activity.items():
-                    idle_time = now - last
-                    if idle_time > idle_timeout:
-                        if platform in self._acp_clients and self._acp_clients[platform].is_running():
-                            log.info("[Gateway] [%s] Idle timeout (%.0fs)", platform, idle_time)
-                            platforms_to_stop.append(platform)
+            clients = self._acp_clients
+            now = time.time()
+            for platform, last in list(self._last_activity.items()):
+                acp = clients.get(platform)
+                if acp is None or not acp.is_running():
+                    continue
+                idle_time = now - last
+                if idle_time >= idle_timeout:
+                    log.info("[Gateway] [%s] Idle timeout (%.0fs)", platform, idle_time)
+                    platforms_to_stop.append(platform)
+                else:
+                    wait = min(wait, idle_timeout - idle_time)
             
-            # Stop outside the lock
             for platform in platforms_to_stop:
                 self._stop_acp(platform)
 
@@ -266,7 +312,10 @@ class Gateway:
         """Send text message via appropriate adapter."""
         adapter = self._get_adapter(platform)
         if adapter:
-            adapter.send_text(chat_id, text)
+            try:
+                adapter.send_text(chat_id, text)
+            except AdapterError as e:
+                log.error("[Gateway] [%s] Failed to send text to %s: %s", platform, chat_id, e)
 
     def _send_text_nowait(self, platform: str, chat_id: str, text: str):
         """Send text message without blocking (for command responses).
@@ -278,26 +327,43 @@ class Gateway:
             if hasattr(adapter, 'send_text_nowait'):
                 adapter.send_text_nowait(chat_id, text)
             else:
-                adapter.send_text(chat_id, text)
+                self._send_text(platform, chat_id, text)
 
     def _send_card(self, platform: str, chat_id: str, content: str, title: str = "") -> CardHandle | None:
         """Send card via appropriate adapter."""
         adapter = self._get_adapter(platform)
         if adapter:
-            return adapter.send_card(chat_id, content, title)
+            try:
+                return adapter.send_card(chat_id, content, title)
+            except AdapterError as e:
+                log.error("[Gateway] [%s] Failed to send card to %s: %s", platform, chat_id, e)
         return None
 
     def _update_card(self, platform: str, handle: CardHandle, content: str, title: str = "") -> bool:
         """Update card via appropriate adapter."""
         adapter = self._get_adapter(platform)
         if adapter:
-            return adapter.update_card(handle, content, title)
+            try:
+                return adapter.update_card(handle, content, title)
+            except AdapterError as e:
+                log.error("[Gateway] [%s] Failed to update card %s: %s", platform, handle.message_id, e)
         return False
 
+    def _reply(self, platform: str, chat_id: str, card_handle: CardHandle | None, text: str):
+        """Show a reply in the chat's card, falling back to a text message.
+        
+        Used when there is no card, or when the update failed, so the reply
+        isn't lost behind "Thinking...".
+        """
+        if card_handle and self._update_card(platform, card_handle, text):
+            return
+        self._send_text(platform, chat_id, text)
+
     def _handle_permission(self, request: PermissionRequest, platform: str) -> str | None:
         """Handle permission request from Kiro."""
         session_id = request.session_id
-        key = self._session_to_key.get(session_id)
+        with self._contexts_lock:
+            key = self._session_to_key.get(session_id)
         if not key:
             log.warning("[Gateway] [%s] No chat found for session %s, auto-denying", platform, session_id)
             return "deny"
@@ -344,7 +410,7 @@ class Gateway:
         
         chat_id = msg.chat_id
         text = msg.text.strip()
-        text_lower = text.lower()
+        text_lower = text.lower() if len(text) <= _KEYWORD_MAX_LEN else ""
         images = msg.images
         key = self._make_key(platform, chat_id)
 
@@ -357,15 +423,15 @@ class Gateway:
         
         if pending:
             evt, result_holder = pending
-            if text_lower in ('y', 'yes', 'ok'):
+            if text_lower in _PERM_ALLOW_ONCE:
                 result_holder.append("allow_once")
                 evt.set()
                 return
-            elif text_lower in ('n', 'no'):
+            elif text_lower in _PERM_DENY:
                 result_holder.append("deny")
                 evt.set()
                 return
-            elif text_lower in ('t', 'trust', 'always'):
+            elif text_lower in _PERM_ALLOW_ALWAYS:
                 result_holder.append("allow_always")
                 evt.set()
                 return
@@ -374,7 +440,7 @@ class Gateway:
                 return
 
         # Cancel command
-        if text_lower in ("cancel", "stop"):
+        if text_lower in _CANCEL_WORDS:
             self._handle_cancel(platform, chat_id, key)
             return
 
@@ -383,12 +449,9 @@ class Gateway:
             self._handle_command(platform, chat_id, key, text)
             return
 
-        # Process message in thread
-        threading.Thread(
-            target=self._process_message,
-            args=(platform, chat_id, key, text, images),
-            daemon=True,
-        ).start()
+        # Process message on a worker thread
+        future = self._executor.submit(self._process_message, platform, chat_id, key, text, images)
+        future.add_done_callback(lambda f, k=key: self._log_worker_error(f, k))
 
     def _handle_cancel(self, platform: str, chat_id: str, key: str):
         """Handle cancel command.
@@ -437,14 +500,11 @@ class Gateway:
         cmd = parts[0].lower()
         arg = parts[1].strip() if len(parts) > 1 else ""
 
-        if cmd == "/agent":
-            self._handle_agent_command(platform, chat_id, key, arg)
-        elif cmd == "/model":
-            self._handle_model_command(platform, chat_id, key, arg)
-        elif cmd == "/help":
-            self._handle_help_command(platform, chat_id)
-        else:
+        handler = self._COMMAND_HANDLERS.get(cmd)
+        if handler is None:
             self._send_text_nowait(platform, chat_id, f"❓ Unknown command: {cmd}\n💡 Send /help for available commands")
+            return
+        handler(self, platform, chat_id, key, arg)
 
     def _handle_agent_command(self, platform: str, chat_id: str, key: str, mode_arg: str):
         """Handle /agent command (text-based)."""
@@ -466,10 +526,17 @@ class Gateway:
         response = self._get_model_response(acp, session_id, model_arg)
         self._send_text_nowait(platform, chat_id, response)
 
-    def _handle_help_command(self, platform: str, chat_id: str):
+    def _handle_help_command(self, platform: str, chat_id: str, key: str, arg: str):
         """Show help."""
         self._send_text_nowait(platform, chat_id, self._get_help_text())
 
+    # Text command -> handler(self, platform, chat_id, key, arg)
+    _COMMAND_HANDLERS = {
+        "/agent": _handle_agent_command,
+        "/model": _handle_model_command,
+        "/help": _handle_help_command,
+    }
+
     def _handle_slash_command(self, platform: str, chat_id: str, cmd: str, args: str) -> str | None:
         """Handle slash command from Discord adapter.
         
@@ -621,22 +688,36 @@ class Gateway:
             except Exception as e:
                 return f"❌ Switch failed: {e}"
 
-    def _process_message(self, platform: str, chat_id: str, key: str, text: str, images: list[tuple[str, str]] | None = None):
+    def _log_worker_error(self, future, key: str):
+        """Log an exception that escaped a message worker (the pool would drop it)."""
+        if future.cancelled():
+            return
+        e = future.exception()
+        if e is not None:
+            log.error("[Gateway] [%s] Message worker failed", key, exc_info=e)
+
+    def _process_message(self, platform: str, chat_id: str, key: str, text: str, images: list[tuple[bytes, str]] | None = None):
         """Process a message, queuing if busy."""
         with self._processing_lock:
-            if self._processing.get(key):
+            busy = self._processing.get(key)
+            if busy:
                 with self._queue_lock:
-                    if key not in self._message_queue:
-                        self._message_queue[key] = []
-                    queue = self._message_queue[key]
-                    if len(queue) < 5:
+                    queue = self._message_queue.setdefault(key, deque())
+                    queued = len(queue) < 5
+                    if queued:
                         queue.append((text, images))
-                        self._send_text(platform, chat_id, f"📥 Queued #{len(queue)}\n💡 Send 'cancel' to clear")
-                        log.info("[Gateway] [%s] Message queued, size: %d", key, len(queue))
-                    else:
-                        self._send_text(platform, chat_id, "⚠️ Queue full (max 5)")
-                return
-            self._processing[key] = True
+                    size = len(queue)
+            else:
+                self._processing[key] = True
+
+        # Reply outside the locks so a slow send doesn't block other chats
+        if busy:
+            if queued:
+                self._send_text(platform, chat_id, f"📥 Queued #{size}\n💡 Send 'cancel' to clear")
+                log.info("[Gateway] [%s] Message queued, size: %d", key, size)
+            else:
+                self._send_text(platform, chat_id, "⚠️ Queue full (max 5)")
+            return
 
         try:
             self._process_message_loop(platform, chat_id, key, text, images)
@@ -644,21 +725,23 @@ class Gateway:
             with self._processing_lock:
                 self._processing[key] = False
 
-    def _process_message_loop(self, platform: str, chat_id: str, key: str, text: str, images: list[tuple[str, str]] | None = None):
+    def _process_message_loop(self, platform: str, chat_id: str, key: str, text: str, images: list[tuple[bytes, str]] | None = None):
         """Process current and queued messages."""
         while True:
             self._process_single_message(platform, chat_id, key, text, images)
             
-            with self._queue_lock:
-                queue = self._message_queue.get(key, [])
+            # Same lock order as the enqueue path, so a message can't be
+            # queued after the last check but before _processing is cleared
+            with self._processing_lock, self._queue_lock:
+                queue = self._message_queue.get(key)
                 if not queue:
-                    if key in self._message_queue:
-                        del self._message_queue[key]
+                    self._message_queue.pop(key, None)
+                    self._processing[key] = False
                     break
-                text, images = queue.pop(0)
+                text, images = queue.popleft()
                 log.info("[Gateway] [%s] Processing queued, remaining: %d", key, len(queue))
 
-    def _process_single_message(self, platform: str, chat_id: str, key: str, text: str, images: list[tuple[str, str]] | None = None):
+    def _process_single_message(self, platform: str, chat_id: str, key: str, text: str, images: list[tuple[bytes, str]] | None = None):
         """Process a single message."""
         card_handle = None
         adapter = self._adapter_map.get(platform)
@@ -675,15 +758,10 @@ class Gateway:
                 acp = self._ensure_acp(platform)
             except Exception as e:
                 log.error("[Gateway] [%s] Failed to start kiro-cli: %s", platform, e)
-                error_msg = f"❌ Failed to start Kiro: {e}"
-                if card_handle:
-                    self._update_card(platform, card_handle, error_msg)
-                else:
-                    self._send_text(platform, chat_id, error_msg)
+                self._reply(platform, chat_id, card_handle, f"❌ Failed to start Kiro: {e}")
                 return
 
             session_id = self._get_or_create_session(platform, chat_id, key, acp)
-            self._session_to_key[session_id] = key
 
             # Send to Kiro
             max_retries = 3
@@ -698,21 +776,19 @@ class Gateway:
                     if "ValidationException" in error_str or "Internal error" in error_str:
                         if attempt < max_retries - 1:
                             log.warning("[Gateway] [%s] Transient error (attempt %d/%d): %s", platform, attempt + 1, max_retries, e)
-                            time.sleep(1)
-                            continue
+                            # Full jitter, so chats hit by the same error don't retry
+                            # in lockstep; the shutdown signal cuts the wait short
+                            backoff = random.uniform(0, min(2 ** attempt, _RETRY_BACKOFF_MAX))
+                            if not self._idle_checker_stop.wait(backoff):
+                                continue
                     raise
             else:
                 raise last_error
 
             # Update activity
-            with self._acp_lock:
-                self._last_activity[platform] = time.time()
+            self._last_activity[platform] = time.time()
 
-            response = format_response(result)
-            if card_handle:
-                self._update_card(platform, card_handle, response)
-            else:
-                self._send_text(platform, chat_id, response)
+            self._reply(platform, chat_id, card_handle, format_response(result))
 
         except Exception as e:
             log.exception("[Gateway] [%s] Error: %s", platform, e)
@@ -722,21 +798,20 @@ class Gateway:
             else:
                 error_text = f"❌ Error: {e}"
             
-            if card_handle:
-                self._update_card(platform, card_handle, error_text)
-            else:
-                self._send_text(platform, chat_id, error_text)
+            self._reply(platform, chat_id, card_handle, error_text)
             
             with self._contexts_lock:
-                self._contexts.pop(key, None)
+                ctx = self._contexts.pop(key, None)
+                if ctx and ctx.session_id:
+                    self._session_to_key.pop(ctx.session_id, None)
+                self._platform_keys[platform].discard(key)
             
             # Check if this platform's ACP died
             with self._acp_lock:
                 acp = self._acp_clients.get(platform)
                 if acp is not None and not acp.is_running():
                     log.warning("[Gateway] [%s] kiro-cli died, will restart on next message", platform)
-                    self._acp_clients.pop(platform, None)
-                    self._last_activity.pop(platform, None)
+                    self._remove_acp(platform)
         
         finally:
             # Always stop typing loop when done
@@ -747,17 +822,22 @@ class Gateway:
         """Get or create ACP session for a chat."""
         # Get working directory based on workspace_mode (fixed or per_chat)
         work_dir = self._config.get_session_cwd(platform, chat_id)
-        os.makedirs(work_dir, exist_ok=True)
+        if work_dir not in self._created_dirs:
+            os.makedirs(work_dir, exist_ok=True)
+            self._created_dirs.add(work_dir)
 
         with self._contexts_lock:
             ctx = self._contexts.get(key)
-            if ctx and ctx.session_id:
-                try:
-                    acp.session_load(ctx.session_id, work_dir)
-                    log.info("[Gateway] [%s] Loaded session", key)
-                    return ctx.session_id
-                except Exception as e:
-                    log.warning("[Gateway] [%s] Failed to load session: %s", key, e)
+            session_id = ctx.session_id if ctx else None
+
+        # Only one thread processes a key at a time, so the RPC can run unlocked
+        if session_id:
+            try:
+                acp.session_load(session_id, work_dir)
+                log.info("[Gateway] [%s] Loaded session", key)
+                return session_id
+            except Exception as e:
+                log.warning("[Gateway] [%s] Failed to load session: %s", key, e)
 
         session_id, modes = acp.session_new(work_dir)
         log.info("[Gateway] [%s] Created session %s (cwd: %s)", key, session_id, work_dir)
@@ -768,5 +848,6 @@ class Gateway:
                 platform=platform,
                 session_id=session_id,
             )
-        self._session_to_key[session_id] = key
+            self._platform_keys[platform].add(key)
+            self._session_to_key[session_id] = key
         return session_id